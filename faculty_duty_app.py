@@ -1,22 +1,39 @@
 # faculty_duty_app.py
 import streamlit as st
 import pandas as pd
+import numpy as np
 import datetime
-from collections import defaultdict
+import functools
+import time
+from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from copy import deepcopy
 from docx import Document
 from docx.shared import Pt, Mm
-from docx.enum.table import WD_ROW_HEIGHT_RULE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 import importlib
 import os
 import pickle
 import collections
 import re
+import orjson
+import xlsxwriter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+try:
+    import solver_core
+except ImportError:
+    solver_core = None
 
 st.set_page_config(page_title="Faculty Duty Assignment System", layout="wide")
 
 # --- Utility Functions ---
 def to_ddmmyyyy(date):
+    # Hot path: nearly every caller passes a plain datetime.date, so skip the
+    # null/str/Timestamp coercion dance for that case.
+    if type(date) is datetime.date:
+        return date.strftime('%d-%m-%Y')
     if pd.isnull(date) or date is None:
         return ''
     if isinstance(date, str):
@@ -34,6 +51,13 @@ def to_ddmmyyyy(date):
         return date.strftime('%d-%m-%Y')
     return ''
 
+@functools.lru_cache(maxsize=None)
+def _fmt_date(date):
+    # The exam schedule only ever holds a handful of distinct dates, but the
+    # slot loops format them inside f-strings on every rerun; cache the
+    # formatted strings for the life of the session.
+    return to_ddmmyyyy(date)
+
 def from_ddmmyyyy(date_str):
     try:
         return pd.to_datetime(date_str, format='%d-%m-%Y', errors='coerce').date()
@@ -42,11 +66,17 @@ def from_ddmmyyyy(date_str):
 
 def normalize_dates(df, col='Date'):
     if col in df.columns:
-        df[col] = pd.to_datetime(df[col], errors='coerce').dt.date
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            # already parsed; just strip the time component
+            df[col] = df[col].dt.date
+        else:
+            df[col] = pd.to_datetime(df[col], errors='coerce').dt.date
     return df
 
 def normalize_schedule(schedule):
     for day in schedule:
+        if type(day['date']) is datetime.date:
+            continue
         if not isinstance(day['date'], (pd.Timestamp, )):
             day['date'] = pd.to_datetime(day['date'], errors='coerce')
         if hasattr(day['date'], 'date') and day['date'] is not None and not pd.isnull(day['date']):
@@ -58,6 +88,9 @@ def normalize_unavailability(unavailability):
         for half in ['first_half', 'second_half']:
             new_dates = set()
             for d in unavailability[faculty][half]:
+                if type(d) is datetime.date:
+                    new_dates.add(d)
+                    continue
                 try:
                     parsed_date = pd.to_datetime(d, errors='coerce').date()
                     if parsed_date is not None and not pd.isnull(parsed_date):
@@ -67,65 +100,179 @@ def normalize_unavailability(unavailability):
             unavailability[faculty][half] = new_dates
     return unavailability
 
+@st.cache_data(show_spinner=False)
+def _normalize_unavailability_cached(key):
+    # Rebuild the dict-of-sets shape from the hashable key and normalize it
+    # once; identical contents on later reruns are a cache hit.
+    unavailability = {}
+    for faculty, half, dates in key:
+        unavailability.setdefault(faculty, {"first_half": set(), "second_half": set()})[half].update(dates)
+    return normalize_unavailability(unavailability)
+
+def cached_normalize_unavailability(unavailability):
+    # st.cache_data can't hash a dict-of-sets of dates, so flatten it into a
+    # sorted tuple of (faculty, half, date-strings) entries first.
+    key = tuple(sorted(
+        (f, half, tuple(sorted(str(d) for d in halves.get(half, ()))))
+        for f, halves in unavailability.items()
+        for half in ('first_half', 'second_half')))
+    return _normalize_unavailability_cached(key)
+
+def unavail_to_df(unavailability):
+    # Long-form columnar view of the per-faculty unavailability sets
+    # (Faculty / Shift / Date), so consumers can merge against assignment
+    # frames instead of walking dict-of-sets in Python.
+    faculties, shifts, dates = [], [], []
+    for faculty, halves in unavailability.items():
+        for half, shift in (('first_half', 'First Half'), ('second_half', 'Second Half')):
+            for d in halves[half]:
+                try:
+                    parsed = pd.to_datetime(d, errors='coerce')
+                except Exception:
+                    continue
+                if pd.isnull(parsed):
+                    continue
+                faculties.append(faculty)
+                shifts.append(shift)
+                dates.append(parsed.date())
+    return pd.DataFrame({'Faculty': faculties, 'Shift': shifts, 'Date': dates})
+
+def get_unavail_df(unavailability):
+    # The UI keeps editing the dict-of-sets in place, so cache the columnar
+    # view keyed on the current contents and rebuild only when they change.
+    key = hash(tuple(sorted(
+        (f, half, tuple(sorted(str(d) for d in halves[half])))
+        for f, halves in unavailability.items()
+        for half in ('first_half', 'second_half'))))
+    cached = st.session_state.get('_unavail_df')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    unavail_df = unavail_to_df(unavailability)
+    st.session_state['_unavail_df'] = (key, unavail_df)
+    return unavail_df
+
+@st.cache_data(show_spinner=False)
+def _schedule_display_df(schedule_key):
+    # schedule_key is a hashable tuple of (date, first_half, second_half)
+    return pd.DataFrame({
+        'Date': [to_ddmmyyyy(d) for d, _, _ in schedule_key],
+        'First Half Required': [fh for _, fh, _ in schedule_key],
+        'Second Half Required': [sh for _, _, sh in schedule_key]
+    })
+
+def schedule_display_df(exam_schedule):
+    # list-of-dicts isn't hashable, so flatten before hitting the cache
+    return _schedule_display_df(tuple(
+        (day['date'], day['first_half'], day['second_half']) for day in exam_schedule))
+
+@st.cache_data(show_spinner=False)
+def clean_faculty_list(faculty_tuple):
+    # Drop NaN/empty entries and stray whitespace once per distinct upload
+    # instead of on every rerun.
+    return [str(f).strip() for f in faculty_tuple if pd.notna(f) and str(f).strip() and str(f).strip().lower() != 'nan']
+
+def get_faculty_list():
+    # The upload step stores the normalized name list; fall back to deriving
+    # it (once) from faculty_df for sessions resumed from an older saved job.
+    fl = st.session_state.get('faculty_list')
+    if fl is None and st.session_state.get('faculty_df') is not None:
+        fl = clean_faculty_list(tuple(st.session_state.faculty_df['faculty']))
+        st.session_state.faculty_list = fl
+    return fl or []
+
+def attach_contact_info(df):
+    # One left join for Phone No / Email Id / Designation instead of a dict
+    # lookup per assignment row per column on every rerun.
+    fdf = st.session_state.get('faculty_df')
+    if df.empty or fdf is None:
+        return df
+    contact_cols = [c for c in ['Phone No', 'Email Id', 'Designation'] if c in fdf.columns]
+    if not contact_cols:
+        return df
+    contacts = fdf[['faculty'] + contact_cols].rename(columns={'faculty': 'Faculty'})
+    contacts = contacts.drop_duplicates(subset='Faculty', keep='last')
+    df = df.merge(contacts, on='Faculty', how='left')
+    df[contact_cols] = df[contact_cols].fillna('')
+    return df
+
 # --- Constraint Validation ---
+
 def validate_assignment_constraints(df, faculty_list, max_duties_dict, unavailability, faculty_groups, exam_schedule):
+    # errors is a list of (faculty, message) records; faculty is None for
+    # violations not tied to a single person (group / required-count), so
+    # callers can classify by faculty without parsing the message text
     errors = []
     is_valid = True
+    # Format each distinct date (assignments + schedule) once; the error
+    # branches below reuse the cached strings instead of re-running the full
+    # to_ddmmyyyy type dance per message.
+    date_fmt = {d: to_ddmmyyyy(d) for d in pd.unique(df['Date'])}
+    for day in exam_schedule:
+        if day['date'] not in date_fmt:
+            date_fmt[day['date']] = to_ddmmyyyy(day['date'])
     # 1. Faculty unavailability
-    for _, row in df.iterrows():
-        faculty = row['Faculty']
-        date = row['Date']
-        shift = row['Shift']
-        shift_type = 'first_half' if shift == 'First Half' else 'second_half'
-        if faculty in unavailability:
-            unavail_dates = set()
-            for d in unavailability[faculty][shift_type]:
-                try:
-                    unavail_dates.add(pd.to_datetime(d, errors='coerce').date())
-                except Exception:
-                    pass
-            if date in unavail_dates:
-                is_valid = False
-                errors.append(f"{faculty} is assigned on {to_ddmmyyyy(date)} {shift} but marked as unavailable.")
+    # Merge the assignments against the columnar unavailability view; the
+    # surviving rows are exactly the clashes.
+    unavail_df = get_unavail_df(unavailability)
+    if not df.empty and not unavail_df.empty:
+        clashes = df[['Faculty', 'Date', 'Shift']].merge(
+            unavail_df, on=['Faculty', 'Shift', 'Date'], how='inner')
+        for faculty, date, shift in clashes.itertuples(index=False, name=None):
+            is_valid = False
+            errors.append((faculty, f"{faculty} is assigned on {date_fmt[date]} {shift} but marked as unavailable."))
     # 2. Max duties
-    duty_counts = defaultdict(int)
-    for _, row in df.iterrows():
-        faculty = row['Faculty']
-        duty_counts[faculty] += 1
+    duty_counts = df['Faculty'].value_counts().to_dict()
     for faculty in faculty_list:
         max_allowed = max_duties_dict.get(faculty, float('inf'))
-        if duty_counts[faculty] > max_allowed:
+        if duty_counts.get(faculty, 0) > max_allowed:
             is_valid = False
-            errors.append(f"{faculty} has {duty_counts[faculty]} duties assigned, exceeding maximum of {max_allowed}.")
+            errors.append((faculty, f"{faculty} has {duty_counts[faculty]} duties assigned, exceeding maximum of {max_allowed}."))
     # 3. Group togetherness
-    for group in faculty_groups:
-        for _, row in df.iterrows():
-            date = row['Date']
-            shift = row['Shift']
-            assigned = df[(df['Date'] == date) & (df['Shift'] == shift)]['Faculty'].tolist()
-            if any(f in assigned for f in group):
-                if not all(f in assigned for f in group):
+    # Bucket assignments per (date, shift) once, then check each group against
+    # each bucket with set operations instead of re-filtering df per row.
+    if faculty_groups and not df.empty:
+        faculty_by_slot = df.groupby(['Date', 'Shift'])['Faculty'].apply(frozenset).to_dict()
+        for group in faculty_groups:
+            group_set = frozenset(group)
+            for (date, shift), assigned in faculty_by_slot.items():
+                partial = group_set & assigned
+                if partial and partial != group_set:
                     is_valid = False
-                    errors.append(f"Group {', '.join(group)} not assigned together on {to_ddmmyyyy(date)} {shift}.")
+                    errors.append((None, f"Group {', '.join(group)} not assigned together on {date_fmt[date]} {shift}."))
     # 4. Required number of faculty per shift
-    for day in exam_schedule:
-        sched_date = day['date']
-        for shift, label in [('First Half', 'first_half'), ('Second Half', 'second_half')]:
-            required = day[label] if label in day else 0
-            assigned = len(df[(df['Date'] == sched_date) & (df['Shift'] == shift)])
-            if assigned != required:
-                is_valid = False
-                errors.append(f"{assigned} faculty assigned on {to_ddmmyyyy(sched_date)} {shift}, required: {required}.")
+    # Treat the schedule as a columnar frame: melt it to long (date, shift,
+    # required) form and merge the assigned counts in, rather than looping
+    # days and dict keys in Python.
+    # the empty-frame case still needs the (Date, Shift) MultiIndex shape
+    # for the rename_axis/merge below, so no special casing
+    slot_counts = df.groupby(['Date', 'Shift']).size()
+    if exam_schedule:
+        sched_df = pd.DataFrame(exam_schedule)
+        for label in ['first_half', 'second_half']:
+            if label not in sched_df.columns:
+                sched_df[label] = 0
+        sched_df['_day'] = range(len(sched_df))
+        req_long = sched_df.melt(id_vars=['date', '_day'], value_vars=['first_half', 'second_half'],
+                                 var_name='Shift', value_name='required')
+        req_long['Shift'] = req_long['Shift'].map({'first_half': 'First Half', 'second_half': 'Second Half'})
+        req_long['required'] = req_long['required'].fillna(0).astype(int)
+        counts_df = slot_counts.rename('assigned').rename_axis(['date', 'Shift']).reset_index()
+        req_long = req_long.merge(counts_df, on=['date', 'Shift'], how='left')
+        req_long['assigned'] = req_long['assigned'].fillna(0).astype(int)
+        # keep the error messages in schedule order, first half before second
+        req_long = req_long.sort_values(['_day', 'Shift'])
+        for sched_date, shift, required, assigned in req_long[req_long['assigned'] != req_long['required']][
+                ['date', 'Shift', 'required', 'assigned']].itertuples(index=False, name=None):
+            is_valid = False
+            errors.append((None, f"{assigned} faculty assigned on {date_fmt[sched_date]} {shift}, required: {required}."))
     # 5. No faculty assigned to both shifts on the same day
     same_day_double = set()
-    for faculty in faculty_list:
-        dates = df[df['Faculty'] == faculty]['Date']
-        date_counts = dates.value_counts()
-        for d, count in date_counts.items():
-            if count > 1:
-                is_valid = False
-                errors.append(f"{faculty} is assigned to both shifts on {to_ddmmyyyy(d)}.")
-                same_day_double.add((faculty, d))
+    if not df.empty:
+        doubles = df.groupby(['Faculty', 'Date']).size()
+        for (faculty, d), count in doubles[doubles > 1].items():
+            is_valid = False
+            errors.append((faculty, f"{faculty} is assigned to both shifts on {date_fmt[d]}."))
+            same_day_double.add((faculty, d))
     return is_valid, errors, list(same_day_double)
 
 # --- Report Generation Functions ---
@@ -140,35 +287,43 @@ def generate_faculty_summary_excel(df, unavailability=None):
             df = pd.DataFrame({col: pd.Series(dtype='object') for col in ['Faculty', 'Date', 'Shift']})
         else:
             df = df.copy()
-            df['Date'] = pd.to_datetime(df['Date'], errors='coerce').dt.date
+            df = normalize_dates(df)
+        # Format each faculty's unavailability once; both branches below used
+        # to redo the sort/strftime/len dance per faculty (four lookups each).
+        if unavailability:
+            unavail_cache = {
+                f: (
+                    ', '.join(d.strftime('%d-%m-%Y') for d in sorted(v['first_half'])) or 'None',
+                    ', '.join(d.strftime('%d-%m-%Y') for d in sorted(v['second_half'])) or 'None',
+                    len(v['first_half']) + len(v['second_half']),
+                )
+                for f, v in unavailability.items()
+            }
+        else:
+            unavail_cache = {}
+        no_unavail = ('None', 'None', 0)
         if faculty_list is not None:
+            # Aggregate counts and per-shift date strings in a single pass over
+            # df instead of filtering the whole frame once per faculty.
+            counts = df.groupby(['Faculty', 'Shift']).size().unstack(fill_value=0)
+            date_lists = df.assign(
+                _date_str=pd.to_datetime(df['Date'], errors='coerce').dt.strftime('%d-%m-%Y')
+            ).dropna(subset=['_date_str']).groupby(['Faculty', 'Shift'])['_date_str'].agg(', '.join).unstack()
+            for shift in ['First Half', 'Second Half']:
+                if shift not in counts.columns:
+                    counts[shift] = 0
+                if shift not in date_lists.columns:
+                    date_lists[shift] = ''
+            counts = counts.reindex(faculty_list, fill_value=0)
+            date_lists = date_lists.reindex(faculty_list).fillna('')
             summary_rows = []
             for faculty in faculty_list:
-                faculty_df = df[df['Faculty'] == faculty]
-                first_half_count = (faculty_df['Shift'] == 'First Half').sum()
-                second_half_count = (faculty_df['Shift'] == 'Second Half').sum()
-                total_duties = len(faculty_df)
-                fh_list = faculty_df.loc[faculty_df['Shift'] == 'First Half', 'Date'].to_list()
-                sh_list = faculty_df.loc[faculty_df['Shift'] == 'Second Half', 'Date'].to_list()
-                fh_dates = pd.Series(list(pd.to_datetime(fh_list, errors='coerce')), dtype='datetime64[ns]')
-                sh_dates = pd.Series(list(pd.to_datetime(sh_list, errors='coerce')), dtype='datetime64[ns]')
-                if not fh_dates.empty and pd.api.types.is_datetime64_any_dtype(fh_dates):
-                    first_half_dates = ', '.join(fh_dates.dt.strftime('%d-%m-%Y'))
-                else:
-                    first_half_dates = ''
-                if not sh_dates.empty and pd.api.types.is_datetime64_any_dtype(sh_dates):
-                    second_half_dates = ', '.join(sh_dates.dt.strftime('%d-%m-%Y'))
-                else:
-                    second_half_dates = ''
-                if unavailability:
-                    fh_unavail = ', '.join(d.strftime('%d-%m-%Y') for d in sorted(unavailability.get(faculty, {'first_half': set()})['first_half'])) or 'None'
-                    sh_unavail = ', '.join(d.strftime('%d-%m-%Y') for d in sorted(unavailability.get(faculty, {'second_half': set()})['second_half'])) or 'None'
-                    total_unavail = len(unavailability.get(faculty, {'first_half': set(), 'second_half': set()})['first_half']) + \
-                                   len(unavailability.get(faculty, {'first_half': set(), 'second_half': set()})['second_half'])
-                else:
-                    fh_unavail = 'None'
-                    sh_unavail = 'None'
-                    total_unavail = 0
+                first_half_count = int(counts.at[faculty, 'First Half'])
+                second_half_count = int(counts.at[faculty, 'Second Half'])
+                total_duties = first_half_count + second_half_count
+                first_half_dates = date_lists.at[faculty, 'First Half']
+                second_half_dates = date_lists.at[faculty, 'Second Half']
+                fh_unavail, sh_unavail, total_unavail = unavail_cache.get(faculty, no_unavail)
                 summary_rows.append({
                     'Faculty': faculty,
                     'First Half Duties': first_half_count,
@@ -194,48 +349,38 @@ def generate_faculty_summary_excel(df, unavailability=None):
                 index=faculty_summary.index
             )
             faculty_summary.drop('Shift', axis=1, inplace=True)
-            def get_shift_dates(faculty, shift):
-                dates = df[(df['Faculty'] == faculty) & (df['Shift'] == shift)]['Date']
-                if not isinstance(dates, pd.Series):
-                    dates = pd.Series(dates)
-                if not pd.api.types.is_datetime64_any_dtype(dates):
-                    dates = pd.to_datetime(dates, errors='coerce')
-                dates = dates.dropna()
-                if not dates.empty:
-                    return ', '.join(dates.dt.strftime('%d-%m-%Y'))
-                else:
-                    return ''
-            faculty_summary['First Half Dates'] = faculty_summary['Faculty'].apply(
-                lambda f: get_shift_dates(f, 'First Half')
-            )
-            faculty_summary['Second Half Dates'] = faculty_summary['Faculty'].apply(
-                lambda f: get_shift_dates(f, 'Second Half')
-            )
-            if unavailability:
-                faculty_summary['First Half Unavailable'] = faculty_summary['Faculty'].apply(
-                    lambda f: ', '.join(d.strftime('%d-%m-%Y') for d in sorted(unavailability.get(f, {'first_half': set()})['first_half'])) or 'None'
-                )
-                faculty_summary['Second Half Unavailable'] = faculty_summary['Faculty'].apply(
-                    lambda f: ', '.join(d.strftime('%d-%m-%Y') for d in sorted(unavailability.get(f, {'second_half': set()})['second_half'])) or 'None'
-                )
-                faculty_summary['Total Unavailable Slots'] = faculty_summary['Faculty'].apply(
-                    lambda f: len(unavailability.get(f, {'first_half': set(), 'second_half': set()})['first_half']) +
-                            len(unavailability.get(f, {'first_half': set(), 'second_half': set()})['second_half'])
-                )
-            else:
-                faculty_summary['First Half Unavailable'] = 'None'
-                faculty_summary['Second Half Unavailable'] = 'None'
-                faculty_summary['Total Unavailable Slots'] = 0
+            # Format every date once into a string column, then join per
+            # (faculty, shift) in one groupby pass instead of filtering and
+            # re-parsing df for each faculty and shift.
+            date_strs = df.assign(
+                _date_str=pd.to_datetime(df['Date'], errors='coerce').dt.strftime('%d-%m-%Y')
+            ).dropna(subset=['_date_str'])
+            fh_dates_map = date_strs[date_strs['Shift'] == 'First Half'].groupby('Faculty')['_date_str'].agg(', '.join).to_dict()
+            sh_dates_map = date_strs[date_strs['Shift'] == 'Second Half'].groupby('Faculty')['_date_str'].agg(', '.join).to_dict()
+            faculty_summary['First Half Dates'] = faculty_summary['Faculty'].map(fh_dates_map).fillna('')
+            faculty_summary['Second Half Dates'] = faculty_summary['Faculty'].map(sh_dates_map).fillna('')
+            faculty_summary['First Half Unavailable'] = faculty_summary['Faculty'].map(
+                lambda f: unavail_cache.get(f, no_unavail)[0])
+            faculty_summary['Second Half Unavailable'] = faculty_summary['Faculty'].map(
+                lambda f: unavail_cache.get(f, no_unavail)[1])
+            faculty_summary['Total Unavailable Slots'] = faculty_summary['Faculty'].map(
+                lambda f: unavail_cache.get(f, no_unavail)[2])
         output = BytesIO()
-        with pd.ExcelWriter(output, engine="openpyxl") as writer:
-            faculty_summary.to_excel(writer, sheet_name="Faculty Duty Summary", index=False)
-            worksheet = writer.sheets["Faculty Duty Summary"]
-            for idx, col in enumerate(faculty_summary.columns):
-                max_length = max(
-                    faculty_summary[col].astype(str).apply(len).max(),
-                    len(col)
-                ) + 2
-                worksheet.column_dimensions[chr(65 + idx)].width = min(max_length, 50)
+        # xlsxwriter in constant_memory mode streams rows out as they are
+        # written instead of holding the whole workbook as Python objects.
+        # constant_memory requires strict row order, so write the sheet
+        # directly rather than via to_excel (pandas writes column-wise).
+        workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+        worksheet = workbook.add_worksheet("Faculty Duty Summary")
+        for idx, col in enumerate(faculty_summary.columns):
+            # .str.len() runs in C, unlike .apply(len)
+            longest = faculty_summary[col].astype(str).str.len().max()
+            max_length = max(int(longest) if pd.notna(longest) else 0, len(col)) + 2
+            worksheet.set_column(idx, idx, min(max_length, 50))
+        worksheet.write_row(0, 0, list(faculty_summary.columns))
+        for row_idx, row in enumerate(faculty_summary.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_idx, 0, row)
+        workbook.close()
         output.seek(0)
         return output.getvalue()
     except Exception as e:
@@ -244,6 +389,62 @@ def generate_faculty_summary_excel(df, unavailability=None):
         traceback.print_exc()
         return None
 
+# Column layout of the duty-chart tables: (width in mm, paragraph alignment).
+_DUTY_TABLE_COLUMNS = [(25, 'center'), (15.1, 'center'), (60, 'left'), (30, 'center'), (40, 'left')]
+
+def _build_duty_row_template():
+    # Pre-build a fully formatted <w:tr> element (cell widths, alignment,
+    # Times New Roman 11pt) so data rows can be deepcopied in one shot
+    # instead of mutating the DOM cell-by-cell and run-by-run.
+    tr = OxmlElement('w:tr')
+    for width_mm, align in _DUTY_TABLE_COLUMNS:
+        tc = OxmlElement('w:tc')
+        tc_pr = OxmlElement('w:tcPr')
+        tc_w = OxmlElement('w:tcW')
+        tc_w.set(qn('w:w'), str(int(width_mm * 1440 / 25.4)))  # mm -> dxa
+        tc_w.set(qn('w:type'), 'dxa')
+        tc_pr.append(tc_w)
+        tc.append(tc_pr)
+        p = OxmlElement('w:p')
+        p_pr = OxmlElement('w:pPr')
+        jc = OxmlElement('w:jc')
+        jc.set(qn('w:val'), align)
+        p_pr.append(jc)
+        p.append(p_pr)
+        r = OxmlElement('w:r')
+        r_pr = OxmlElement('w:rPr')
+        r_fonts = OxmlElement('w:rFonts')
+        r_fonts.set(qn('w:ascii'), 'Times New Roman')
+        r_fonts.set(qn('w:hAnsi'), 'Times New Roman')
+        r_pr.append(r_fonts)
+        sz = OxmlElement('w:sz')
+        sz.set(qn('w:val'), '22')  # half-points, i.e. 11pt
+        r_pr.append(sz)
+        r.append(r_pr)
+        t = OxmlElement('w:t')
+        r.append(t)
+        p.append(r)
+        tc.append(p)
+        tr.append(tc)
+    return tr
+
+def _append_duty_row(tbl, template, values, vmerge=None):
+    # Copy the formatted template row, fill in the cell texts and append it
+    # directly to the table XML. vmerge='restart'/'continue' vertically merges
+    # the Shift column the same way python-docx cell.merge() would.
+    tr = deepcopy(template)
+    cells = tr.findall(qn('w:tc'))
+    for tc, value in zip(cells, values):
+        t = tc.find(qn('w:p')).find(qn('w:r')).find(qn('w:t'))
+        t.text = str(value)
+    if vmerge is not None:
+        tc_pr = cells[0].find(qn('w:tcPr'))
+        vm = OxmlElement('w:vMerge')
+        if vmerge == 'restart':
+            vm.set(qn('w:val'), 'restart')
+        tc_pr.append(vm)
+    tbl.append(tr)
+
 def generate_word_doc(df):
     df = df.copy()
     # Always keep Date as datetime.date for logic, only format for display
@@ -304,11 +505,9 @@ def generate_word_doc(df):
     run_time.font.name = 'Times New Roman'
     run_time.font.size = Pt(12)
     p3.alignment = 1  # Center align (optional)
-    # Get unique dates and sort them
-    unique_dates = sorted(df["Date"].unique())
-    for date in unique_dates:
-        if pd.isna(date):
-            continue
+    # One sorted scan grouped by date, instead of a boolean mask per date
+    row_template = _build_duty_row_template()
+    for date, df_for_date in df.sort_values(["Date", "Shift"]).groupby("Date", sort=True):
         # Add date display before the table as bold paragraph
         doc.add_paragraph()  # Add some space before the date display
         date_para = doc.add_paragraph()
@@ -318,24 +517,13 @@ def generate_word_doc(df):
         date_run.bold = True
         date_run.font.name = 'Times New Roman'
         date_run.font.size = Pt(12)
-        # Filter DataFrame for the current date
-        df_for_date = df[df["Date"] == date].copy()
-        # Sort by shift for correct merging order
-        df_for_date = df_for_date.sort_values(by=["Shift"])
-        # Calculate total rows needed including blank row between shifts
-        total_rows = len(df_for_date) + 1  # +1 for header
-        if "First Half" in df_for_date["Shift"].values and "Second Half" in df_for_date["Shift"].values:
-            total_rows += 1  # Add one more row for blank row between shifts
-        # Create table with calculated rows
-        table = doc.add_table(rows=total_rows, cols=5)
+        # Create the table with just the header row; data rows are appended
+        # as pre-built XML elements below.
+        table = doc.add_table(rows=1, cols=5)
         table.style = "Table Grid"
         # Set column widths (in mm)
-        table.columns[0].width = Mm(25)  # Shift column
-        table.columns[1].width = Mm(15.1)  # S.No column (1.51 cm = 15.1 mm)
-        table.columns[2].width = Mm(60)  # Faculty column
-        table.columns[4].width = Mm(40)  # Email ID column
-        table.columns[3].width = Mm(30)  # Phone No column
-        table.columns[4].width = Mm(40)  # Email ID column
+        for col_idx, (width_mm, _) in enumerate(_DUTY_TABLE_COLUMNS):
+            table.columns[col_idx].width = Mm(width_mm)
         # Add header row
         hdr_cells = table.rows[0].cells
         headers = ["Shift", "S.No", "Faculty", "Phone No", "Email ID"]
@@ -349,82 +537,32 @@ def generate_word_doc(df):
                 run.bold = True
                 run.font.name = 'Times New Roman'
                 run.font.size = Pt(12)
-        # Add data rows for this date
-        current_row = 1  # Start from row 1 (after header)
-        serial_no = 1  # Reset serial number for each date's table
-        first_half_rows = []
-        second_half_rows = []
-        # Collect rows for each shift
-        for idx, row in df_for_date.iterrows():
-            if row["Shift"] == "First Half":
-                first_half_rows.append(row)
-            elif row["Shift"] == "Second Half":
-                second_half_rows.append(row)
-        # Write First Half rows
-        for i, row in enumerate(first_half_rows):
-            while current_row >= len(table.rows):
-                table.add_row()
-            row_cells = table.rows[current_row].cells
-            row_cells[0].text = str(row["Shift"]) if i == 0 else ""
-            row_cells[1].text = str(serial_no)
-            row_cells[2].text = str(row["Faculty"])
-            row_cells[3].text = str(row.get("Phone No", ""))
-            row_cells[4].text = str(row.get("Email Id", ""))
-            for j, cell in enumerate(row_cells):
-                if j in [2, 4]:
-                    cell.paragraphs[0].alignment = 0  # Left align
-                else:
-                    cell.paragraphs[0].alignment = 1  # Center align
-                for run in cell.paragraphs[0].runs:
-                    run.font.name = 'Times New Roman'
-                    run.font.size = Pt(11)
-            serial_no += 1
-            current_row += 1
-        first_half_end_row = current_row - 1 if first_half_rows else None
-        # Add a single blank row if both shifts exist
-        if first_half_rows and second_half_rows:
-            while current_row >= len(table.rows):
-                table.add_row()
-            blank_cells = table.rows[current_row].cells
-            for cell in blank_cells:
-                cell.text = ""
-            current_row += 1
-        # Write Second Half rows
-        serial_no = 1
-        second_half_start_row = current_row
-        for i, row in enumerate(second_half_rows):
-            while current_row >= len(table.rows):
-                table.add_row()
-            row_cells = table.rows[current_row].cells
-            row_cells[0].text = str(row["Shift"]) if i == 0 else ""
-            row_cells[1].text = str(serial_no)
-            row_cells[2].text = str(row["Faculty"])
-            row_cells[3].text = str(row.get("Phone No", ""))
-            row_cells[4].text = str(row.get("Email Id", ""))
-            for j, cell in enumerate(row_cells):
-                if j in [2, 4]:
-                    cell.paragraphs[0].alignment = 0  # Left align
-                else:
-                    cell.paragraphs[0].alignment = 1  # Center align
-                for run in cell.paragraphs[0].runs:
-                    run.font.name = 'Times New Roman'
-                    run.font.size = Pt(11)
-            serial_no += 1
-            current_row += 1
-        # Merge cells for First Half
-        if first_half_rows:
-            try:
-                merged_cell = table.cell(1, 0).merge(table.cell(first_half_end_row, 0))
-                merged_cell.vertical_alignment = WD_ROW_HEIGHT_RULE.AT_LEAST
-            except Exception as e:
-                print(f"Error merging First Half cells: {e}")
-        # Merge cells for Second Half
-        if second_half_rows:
-            try:
-                merged_cell = table.cell(second_half_start_row, 0).merge(table.cell(current_row - 1, 0))
-                merged_cell.vertical_alignment = WD_ROW_HEIGHT_RULE.AT_LEAST
-            except Exception as e:
-                print(f"Error merging Second Half cells: {e}")
+        # Materialize the needed columns as native tuples once, instead of
+        # paying a Series __getitem__/get per field per row.
+        rows = list(
+            df_for_date.reindex(columns=["Shift", "Faculty", "Phone No", "Email Id"], fill_value="")
+            .itertuples(index=False, name=None)
+        )
+        first_half_rows = [r for r in rows if r[0] == "First Half"]
+        second_half_rows = [r for r in rows if r[0] == "Second Half"]
+        # Append data rows directly to the table XML; the Shift column is
+        # vertically merged per shift via vMerge restart/continue.
+        tbl = table._tbl
+        for shift_rows in [first_half_rows, second_half_rows]:
+            if shift_rows is second_half_rows and first_half_rows and second_half_rows:
+                # Single blank separator row between the two shifts
+                _append_duty_row(tbl, row_template, [""] * 5)
+            for i, (shift, faculty, phone, email) in enumerate(shift_rows):
+                _append_duty_row(
+                    tbl,
+                    row_template,
+                    [str(shift) if i == 0 else "",
+                     str(i + 1),
+                     str(faculty),
+                     str(phone),
+                     str(email)],
+                    vmerge='restart' if i == 0 else 'continue'
+                )
     # Add a note section at the end
     doc.add_paragraph()
     doc.add_heading("Note:", level=1)
@@ -476,18 +614,84 @@ def generate_word_doc(df):
     buffer.seek(0)
     return buffer.getvalue()
 
+# Cached report bytes: report generation is triggered from several branches
+# per click, so key the xlsx/docx output on the assignment frame contents
+# (and the unavailability/faculty inputs the Excel summary also reads) and
+# let st.cache_data dedupe the work.
+_DF_HASH = {pd.DataFrame: lambda d: pd.util.hash_pandas_object(d).values.tobytes()}
+
+def _unavail_cache_key(unavailability):
+    return tuple(sorted(
+        (f, half, tuple(sorted(str(d) for d in halves[half])))
+        for f, halves in unavailability.items()
+        for half in ('first_half', 'second_half')))
+
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs=_DF_HASH)
+def _excel_report_cached(df, unavail_cache_key, faculty_key, _unavailability):
+    # the key tuples stand in for the unhashable dict-of-sets and the
+    # session faculty list; the underscore arg is passed through unhashed
+    return generate_faculty_summary_excel(df, _unavailability)
+
+def cached_excel_report(df, unavailability):
+    fdf = st.session_state.get('faculty_df')
+    faculty_key = tuple(fdf['faculty']) if fdf is not None and 'faculty' in fdf.columns else ()
+    return _excel_report_cached(df, _unavail_cache_key(unavailability), faculty_key, unavailability)
+
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs=_DF_HASH)
+def _word_report_cached(df, header_key):
+    return generate_word_doc(df)
+
+def cached_word_report(df):
+    # the duty chart header comes from session state, so fold it into the key
+    header_key = (st.session_state.get('exam_type'), st.session_state.get('semester'), st.session_state.get('year'))
+    return _word_report_cached(df, header_key)
+
+def generate_reports_concurrently(df, unavailability):
+    # The two generators touch disjoint data, so overlap xlsx and docx
+    # serialization in a small pool. Workers get the script run context
+    # attached so the generators' session-state reads (and the cache
+    # wrappers) keep working off the main thread.
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=2, initializer=add_script_run_ctx, initargs=(None, ctx)) as ex:
+        fut_excel = ex.submit(cached_excel_report, df, unavailability)
+        fut_word = ex.submit(cached_word_report, df)
+        return fut_excel.result(), fut_word.result()
+
 # --- Auto-load and Resume/Start Fresh Logic ---
-JOB_FILE = "last_job.pkl"
+# orjson serializes/parses several times faster than pickle and does not
+# block the Streamlit thread nearly as long on each auto-save. The legacy
+# pickle file is still read (once) so existing sessions can be resumed.
+JOB_FILE = "last_job.json"
+LEGACY_JOB_FILE = "last_job.pkl"
+
+def job_exists():
+    return os.path.exists(JOB_FILE) or os.path.exists(LEGACY_JOB_FILE)
+
+def _df_to_payload(df):
+    if df is None:
+        return None
+    # orjson rejects NaN, so missing cells become None
+    return {
+        'columns': list(df.columns),
+        'records': df.where(pd.notna(df), None).to_dict(orient='records'),
+    }
+
+def _df_from_payload(payload):
+    if payload is None:
+        return None
+    return pd.DataFrame(payload['records'], columns=payload['columns'])
 
 def save_job():
-    # Convert faculty_unavailability to a regular dict for pickling
-    faculty_unavailability = st.session_state.get('faculty_unavailability')
-    if isinstance(faculty_unavailability, collections.defaultdict):
-        faculty_unavailability = dict(faculty_unavailability)
+    faculty_unavailability = st.session_state.get('faculty_unavailability') or {}
+    unavail = {
+        f: {half: sorted(d.isoformat() for d in halves[half] if d is not None)
+            for half in ('first_half', 'second_half')}
+        for f, halves in faculty_unavailability.items()
+    }
     job_state = {
-        'faculty_df': st.session_state.get('faculty_df'),
-        'faculty_unavailability': faculty_unavailability,
-        'assigned_duty_df': st.session_state.get('assigned_duty_df'),
+        'faculty_df': _df_to_payload(st.session_state.get('faculty_df')),
+        'faculty_unavailability': unavail,
+        'assigned_duty_df': _df_to_payload(st.session_state.get('assigned_duty_df')),
         'faculty_groups': st.session_state.get('faculty_groups'),
         'max_duties_dict': st.session_state.get('max_duties_dict'),
         'exam_schedule': st.session_state.get('exam_schedule'),
@@ -497,16 +701,44 @@ def save_job():
         'year': st.session_state.get('year', '2025'),
     }
     with open(JOB_FILE, 'wb') as f:
-        pickle.dump(job_state, f)
+        f.write(orjson.dumps(job_state, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
 
 def load_job():
     if os.path.exists(JOB_FILE):
         with open(JOB_FILE, 'rb') as f:
+            job_state = orjson.loads(f.read())
+        st.session_state['faculty_df'] = _df_from_payload(job_state.get('faculty_df'))
+        assigned_df = _df_from_payload(job_state.get('assigned_duty_df'))
+        if assigned_df is not None and 'Date' in assigned_df.columns:
+            assigned_df = normalize_dates(assigned_df)
+        st.session_state['assigned_duty_df'] = assigned_df
+        unavail = job_state.get('faculty_unavailability') or {}
+        st.session_state['faculty_unavailability'] = defaultdict(
+            lambda: {"first_half": set(), "second_half": set()},
+            {f: {half: {datetime.date.fromisoformat(d) for d in halves.get(half, [])}
+                 for half in ('first_half', 'second_half')}
+             for f, halves in unavail.items()})
+        schedule = []
+        for day in job_state.get('exam_schedule') or []:
+            schedule.append({
+                'date': datetime.date.fromisoformat(day['date']) if day.get('date') else None,
+                'first_half': day.get('first_half', 0),
+                'second_half': day.get('second_half', 0),
+            })
+        st.session_state['exam_schedule'] = schedule
+        for k in ['faculty_groups', 'max_duties_dict', 'manual_selected']:
+            st.session_state[k] = job_state.get(k)
+        for k, default in [('exam_type', 'MID SEM'), ('semester', 'MO'), ('year', '2025')]:
+            st.session_state[k] = job_state.get(k, default)
+        return True
+    if os.path.exists(LEGACY_JOB_FILE):
+        with open(LEGACY_JOB_FILE, 'rb') as f:
             job_state = pickle.load(f)
         for k, v in job_state.items():
             if k == 'faculty_unavailability':
-                from collections import defaultdict
-                d = v if v is not None else {}
+                # Legacy pickles can hold strings/Timestamps; normalize via
+                # the cached helper so reruns don't re-parse every date.
+                d = cached_normalize_unavailability(v if v is not None else {})
                 st.session_state[k] = defaultdict(lambda: {"first_half": set(), "second_half": set()}, d)
             else:
                 st.session_state[k] = v
@@ -514,15 +746,16 @@ def load_job():
     return False
 
 def clear_job():
-    if os.path.exists(JOB_FILE):
-        os.remove(JOB_FILE)
-    for k in ['faculty_df', 'faculty_unavailability', 'assigned_duty_df', 'faculty_groups', 'max_duties_dict', 'exam_schedule', 'manual_selected', 'exam_type', 'semester', 'year']:
+    for path in (JOB_FILE, LEGACY_JOB_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+    for k in ['faculty_df', 'faculty_list', 'faculty_unavailability', 'assigned_duty_df', 'faculty_groups', 'max_duties_dict', 'exam_schedule', 'manual_selected', '_manual_tallies', '_manual_frame', '_manual_reports', '_validation_cache', 'exam_type', 'semester', 'year']:
         if k in st.session_state:
             del st.session_state[k]
 
 # --- Prompt to Resume or Start Fresh ---
 if 'job_prompt_done' not in st.session_state:
-    if os.path.exists(JOB_FILE):
+    if job_exists():
         st.markdown("""
         <div style='background-color:#f8f9fa; padding:1rem; border-radius:8px; border:1px solid #ddd;'>
         <b>Resume your last job?</b><br>
@@ -545,8 +778,25 @@ if 'job_prompt_done' not in st.session_state:
         st.session_state['job_prompt_done'] = True
 
 # --- After any major change, auto-save the job ---
+SAVE_DEBOUNCE_SECONDS = 2.0
+
 def auto_save_job():
+    # Persisting the whole job after every widget change causes visible UI
+    # stutter. Saves arriving within the debounce window are deferred and
+    # flushed on the next rerun (see flush_pending_save below the sidebar).
+    now = time.time()
+    if now - st.session_state.get('_last_save_ts', 0) < SAVE_DEBOUNCE_SECONDS:
+        st.session_state['_pending_save'] = True
+        return
     save_job()
+    st.session_state['_last_save_ts'] = now
+    st.session_state['_pending_save'] = False
+
+def flush_pending_save():
+    if st.session_state.get('_pending_save'):
+        save_job()
+        st.session_state['_last_save_ts'] = time.time()
+        st.session_state['_pending_save'] = False
 
 # Call auto_save_job after any major change (faculty, exam dates, assignments, etc.)
 # Example: after uploading faculty, exam schedule, or generating assignments, call auto_save_job()
@@ -617,6 +867,8 @@ section = st.sidebar.radio(
         "Reports & Downloads"
     ]
 )
+# Flush any save that was deferred by the debounce window
+flush_pending_save()
 
 # --- Faculty Management ---
 if section == "Faculty Management":
@@ -641,6 +893,9 @@ if section == "Faculty Management":
             faculty_df = faculty_df[~duplicate_names]
         faculty_df = faculty_df.reset_index(drop=True)
         st.session_state.faculty_df = faculty_df
+        # names are normalized above, so keep the list itself around instead
+        # of re-deriving it with astype/strip on every rerun
+        st.session_state.faculty_list = faculty_df['faculty'].tolist()
         # Set max duties dict from file or default
         if 'Max Duties' in faculty_df.columns:
             st.session_state.max_duties_dict = dict(zip(faculty_df['faculty'], faculty_df['Max Duties']))
@@ -665,7 +920,7 @@ if section == "Faculty Management":
     st.subheader('Faculty Grouping (Assign Together)')
     if 'faculty_groups' not in st.session_state:
         st.session_state.faculty_groups = []
-    faculty_list = st.session_state.faculty_df['faculty'].tolist() if st.session_state.faculty_df is not None else []
+    faculty_list = get_faculty_list()
     # Show current groups
     if st.session_state.faculty_groups:
         st.markdown('**Current Groups:**')
@@ -695,57 +950,62 @@ if section == "Faculty Management":
             st.rerun()
     st.markdown('---')
     st.subheader('Faculty Unavailability (by Date & Shift)')
-    faculty_search = st.text_input('Search Faculty', '', key='faculty_unavail_search')
-    st.caption('Type and press Enter or click outside the box to filter.')
-    # Clean faculty list: remove NaN, empty, and strip spaces, ensure all are strings
-    faculty_list = st.session_state.faculty_df['faculty'].tolist() if st.session_state.faculty_df is not None else []
-    faculty_list = [str(f).strip() for f in faculty_list if pd.notna(f) and str(f).strip() and str(f).strip().lower() != 'nan']
-    # Filter by search (case and space insensitive)
-    search_val = faculty_search.strip().lower().replace(' ', '')
-    if search_val:
-        faculty_list = [f for f in faculty_list if search_val in f.lower().replace(' ', '')]
-    if not faculty_list:
-        st.warning('No faculty found matching your search.')
-    if not st.session_state.exam_schedule:
-        st.warning("Please configure the exam schedule first!")
-    else:
-        for faculty in faculty_list:
-            st.markdown(f"**{faculty}**")
-            cols = st.columns(len(st.session_state.exam_schedule) * 2)
-            for i, date in enumerate(st.session_state.exam_schedule):
-                with cols[2*i]:
-                    key_fh = f"unavail_{faculty}_fh_{date['date']}"
-                    unavailable_fh = st.checkbox(
-                        f"{to_ddmmyyyy(date['date'])} First Half",
-                        value=date['date'] in st.session_state.faculty_unavailability[faculty]['first_half'],
-                        key=key_fh
-                    )
-                    if unavailable_fh:
-                        st.session_state.faculty_unavailability[faculty]['first_half'].add(date['date'])
-                    else:
-                        st.session_state.faculty_unavailability[faculty]['first_half'].discard(date['date'])
-                with cols[2*i+1]:
-                    key_sh = f"unavail_{faculty}_sh_{date['date']}"
-                    unavailable_sh = st.checkbox(
-                        f"{to_ddmmyyyy(date['date'])} Second Half",
-                        value=date['date'] in st.session_state.faculty_unavailability[faculty]['second_half'],
-                        key=key_sh
-                    )
-                    if unavailable_sh:
-                        st.session_state.faculty_unavailability[faculty]['second_half'].add(date['date'])
-                    else:
-                        st.session_state.faculty_unavailability[faculty]['second_half'].discard(date['date'])
+
+    # Fragment: edits to the grid (and the search box) rerun only this
+    # function, not the whole script, so toggling one cell no longer
+    # re-renders the rest of the section.
+    @st.fragment
+    def unavailability_fragment():
+        faculty_search = st.text_input('Search Faculty', '', key='faculty_unavail_search')
+        st.caption('Type and press Enter or click outside the box to filter.')
+        # Clean faculty list: remove NaN, empty, and strip spaces, ensure all are strings
+        faculty_list = get_faculty_list()
+        # Filter by search (case and space insensitive)
+        search_val = faculty_search.strip().lower().replace(' ', '')
+        if search_val:
+            faculty_list = [f for f in faculty_list if search_val in f.lower().replace(' ', '')]
+        if not faculty_list:
+            st.warning('No faculty found matching your search.')
+        if not st.session_state.exam_schedule:
+            st.warning("Please configure the exam schedule first!")
+        elif faculty_list:
+            # One editable boolean matrix (faculty x date/shift) instead of two
+            # checkboxes per faculty per date: a single component render no
+            # matter how many faculty/dates there are. The search filter above
+            # restricts the rows before the frame is built.
+            schedule_dates = [day['date'] for day in st.session_state.exam_schedule]
+            unavail_columns = {}
+            for date in schedule_dates:
+                for half, suffix in [('first_half', 'FH'), ('second_half', 'SH')]:
+                    unavail_columns[f"{to_ddmmyyyy(date)} {suffix}"] = [
+                        date in st.session_state.faculty_unavailability[f][half] for f in faculty_list
+                    ]
+            unavail_grid = pd.DataFrame(unavail_columns, index=faculty_list)
+            edited_grid = st.data_editor(
+                unavail_grid,
+                column_config={c: st.column_config.CheckboxColumn(c) for c in unavail_grid.columns},
+                use_container_width=True,
+                key='unavail_editor'
+            )
+            # Apply only the cells that actually changed back to the sets
+            changed = (edited_grid != unavail_grid).stack()
+            for (faculty, col), _ in changed[changed].items():
+                date_str, suffix = col.rsplit(' ', 1)
+                date = datetime.datetime.strptime(date_str, '%d-%m-%Y').date()
+                half = 'first_half' if suffix == 'FH' else 'second_half'
+                if edited_grid.at[faculty, col]:
+                    st.session_state.faculty_unavailability[faculty][half].add(date)
+                else:
+                    st.session_state.faculty_unavailability[faculty][half].discard(date)
+
+    unavailability_fragment()
 
 # --- Exam Schedule ---
 elif section == "Exam Schedule":
     st.header("Exam Schedule")
     # Always show current exam schedule if available
     if st.session_state.exam_schedule:
-        st.dataframe(pd.DataFrame({
-            'Date': [to_ddmmyyyy(day['date']) for day in st.session_state.exam_schedule],
-            'First Half Required': [day['first_half'] for day in st.session_state.exam_schedule],
-            'Second Half Required': [day['second_half'] for day in st.session_state.exam_schedule]
-        }))
+        st.dataframe(schedule_display_df(st.session_state.exam_schedule))
     num_exam_dates = st.number_input("Number of Exam Days Needed", min_value=1, max_value=30, value=len(st.session_state.exam_schedule) or 5)
     temp_schedule = []
     for idx in range(num_exam_dates):
@@ -783,11 +1043,7 @@ elif section == "Duty Assignment":
         st.warning("Please upload faculty details first.")
         st.stop()
     st.subheader("Current Exam Schedule")
-    st.dataframe(pd.DataFrame({
-        'Date': [to_ddmmyyyy(day['date']) for day in st.session_state.exam_schedule],
-        'First Half Required': [day['first_half'] for day in st.session_state.exam_schedule],
-        'Second Half Required': [day['second_half'] for day in st.session_state.exam_schedule]
-    }))
+    st.dataframe(schedule_display_df(st.session_state.exam_schedule))
     st.subheader("Faculty List")
     st.dataframe(st.session_state.faculty_df)
     st.markdown("---")
@@ -795,7 +1051,7 @@ elif section == "Duty Assignment":
     st.info("Assignments will respect all constraints: unavailability, max duties, groupings, and required per shift.")
 
     if st.button("🎲 Generate Assignments"):
-        faculty_list = st.session_state.faculty_df['faculty'].tolist()
+        faculty_list = get_faculty_list()
         max_duties_dict = st.session_state.max_duties_dict.copy()
         unavailability = st.session_state.faculty_unavailability
         faculty_groups = st.session_state.faculty_groups
@@ -810,37 +1066,56 @@ elif section == "Duty Assignment":
         # 2. Total available duties
         total_available = sum(int(st.session_state.max_duties_dict.get(f, 0)) for f in faculty_list)
         st.markdown(f'- **Total available duties (sum of max duties):** {total_available}')
-        # 3. Slot-by-slot feasibility
-        slot_problems = False
+        # 3. Slot-by-slot feasibility: one boolean (faculty x slot) matrix,
+        # summed along axis 0, rendered as a single table instead of one
+        # st.markdown per slot
+        max_arr = np.array([int(max_duties_dict.get(f, 0)) for f in faculty_list])
+        has_duties = max_arr > 0
+        slot_labels = []
+        slot_required = []
+        avail_cols = []
         for day in exam_schedule:
             for shift, label in [('First Half', 'first_half'), ('Second Half', 'second_half')]:
-                required = day[label]
-                date = day['date']
-                available_faculty = [
-                    f for f in faculty_list
-                    if date not in unavailability[f][label]
-                    and int(st.session_state.max_duties_dict.get(f, 0)) > 0
-                ]
-                st.markdown(f'- {to_ddmmyyyy(date)} {shift}: required = {required}, available = {len(available_faculty)}')
-                if required > len(available_faculty):
-                    st.warning(f'⚠️ Not enough available faculty for {to_ddmmyyyy(date)} {shift}: required {required}, available {len(available_faculty)}')
-                    slot_problems = True
+                slot_labels.append(f"{to_ddmmyyyy(day['date'])} {shift}")
+                slot_required.append(day[label])
+                avail_cols.append(
+                    np.array([day['date'] not in unavailability[f][label] for f in faculty_list]) & has_duties
+                )
+        avail = np.column_stack(avail_cols) if avail_cols else np.zeros((len(faculty_list), 0), dtype=bool)
+        available_counts = avail.sum(axis=0)
+        required_arr = np.array(slot_required)
+        slot_problem_mask = required_arr > available_counts
+        slot_problems = bool(slot_problem_mask.any())
+        st.dataframe(pd.DataFrame({
+            'Slot': slot_labels,
+            'Required': required_arr,
+            'Available': available_counts,
+            'OK': ~slot_problem_mask
+        }), hide_index=True, use_container_width=True)
+        if slot_problems:
+            # one message (and one websocket frame) for all offending slots
+            st.warning('⚠️ Not enough available faculty for:\n' + '\n'.join(
+                f'- {slot_labels[i]}: required {required_arr[i]}, available {available_counts[i]}'
+                for i in np.flatnonzero(slot_problem_mask)))
 
-        # 4. Per-day feasibility (no both-shifts constraint)
-        day_problems = False
-        for day in exam_schedule:
-            date = day['date']
-            required_total = day['first_half'] + day['second_half']
-            available_faculty = [
-                f for f in faculty_list
-                if date not in unavailability[f]['first_half']
-                and date not in unavailability[f]['second_half']
-                and int(st.session_state.max_duties_dict.get(f, 0)) > 0
-            ]
-            st.markdown(f'- {to_ddmmyyyy(date)}: total required = {required_total}, available = {len(available_faculty)}')
-            if required_total > len(available_faculty):
-                st.error(f'❌ Not enough available faculty for {to_ddmmyyyy(date)}: required {required_total}, available {len(available_faculty)}')
-                day_problems = True
+        # 4. Per-day feasibility (no both-shifts constraint): a faculty
+        # counts for a day only if available in both halves of it
+        day_avail = avail[:, 0::2] & avail[:, 1::2]
+        day_counts = day_avail.sum(axis=0)
+        day_required = required_arr[0::2] + required_arr[1::2]
+        day_labels = [to_ddmmyyyy(day['date']) for day in exam_schedule]
+        day_problem_mask = day_required > day_counts
+        day_problems = bool(day_problem_mask.any())
+        st.dataframe(pd.DataFrame({
+            'Date': day_labels,
+            'Total Required': day_required,
+            'Available': day_counts,
+            'OK': ~day_problem_mask
+        }), hide_index=True, use_container_width=True)
+        if day_problems:
+            st.error('❌ Not enough available faculty for:\n' + '\n'.join(
+                f'- {day_labels[i]}: required {day_required[i]}, available {day_counts[i]}'
+                for i in np.flatnonzero(day_problem_mask)))
 
         if total_required > total_available:
             st.error('❌ Total required duties exceed total available duties. Assignment is impossible.')
@@ -874,36 +1149,120 @@ elif section == "Duty Assignment":
             singletons = [f for f in faculty_list if f not in grouped]
             # Build assignable units: groups + singletons
             assign_units = all_groups + [(f,) for f in singletons]
-            # Helper: check if a unit is available for a slot
-            def unit_available(unit, date, shift, duty_counts, assigned_slots):
+            # Bitset availability: one bit per faculty, so the hot
+            # availability test below is a couple of integer ops instead of
+            # nested dict/set lookups per call.
+            fac_index = {f: i for i, f in enumerate(faculty_list)}
+            for u in assign_units:
+                for f in u:
+                    if f not in fac_index:
+                        fac_index[f] = len(fac_index)
+            max_duties_dict_int = {f: int(max_duties_dict.get(f, 0)) for f in fac_index}
+            slot_avail = {}
+            for slot in slots:
+                label = 'first_half' if slot['shift'] == 'First Half' else 'second_half'
+                mask = 0
+                for f, i in fac_index.items():
+                    if slot['date'] not in unavailability[f][label]:
+                        mask |= 1 << i
+                slot_avail[(slot['date'], slot['shift'])] = mask
+            unit_mask = {u: sum(1 << fac_index[f] for f in u) for u in assign_units}
+            # --- CP-SAT model (primary solver) ---
+            # One boolean per (unit, slot) with linear constraints for slot
+            # demand, per-faculty duty caps and the one-duty-per-day rule.
+            # CP-SAT solves department-scale instances in milliseconds where
+            # the DFS below can blow up; the pure-Python backtracking/greedy
+            # path is kept as a fallback for environments without OR-Tools
+            # and for reporting underfilled slots on infeasible inputs.
+            try:
+                from ortools.sat.python import cp_model
+            except ImportError:
+                cp_model = None
+            if cp_model is not None:
+                model = cp_model.CpModel()
+                x = {}
+                slot_terms = [[] for _ in slots]
+                fac_terms = defaultdict(list)
+                fac_date_terms = defaultdict(list)
+                for s_idx, slot in enumerate(slots):
+                    label = 'first_half' if slot['shift'] == 'First Half' else 'second_half'
+                    for u_idx, unit in enumerate(assign_units):
+                        # don't create variables that could never be 1
+                        if any(slot['date'] in unavailability[f][label] or max_duties_dict_int.get(f, 0) < 1 for f in unit):
+                            continue
+                        var = model.NewBoolVar(f'x_{u_idx}_{s_idx}')
+                        x[(u_idx, s_idx)] = var
+                        # a group unit contributes all of its members at once
+                        slot_terms[s_idx].append(len(unit) * var)
+                        for f in unit:
+                            fac_terms[f].append(var)
+                            fac_date_terms[(f, slot['date'])].append(var)
+                model_ok = True
+                for s_idx, slot in enumerate(slots):
+                    if not slot_terms[s_idx] and slot['required'] > 0:
+                        model_ok = False
+                        break
+                    model.Add(sum(slot_terms[s_idx]) == slot['required'])
+                if model_ok:
+                    for f, terms in fac_terms.items():
+                        model.Add(sum(terms) <= max_duties_dict_int.get(f, 0))
+                    # at most one duty per faculty per date: covers both the
+                    # no-both-shifts rule and overlapping units in one slot
+                    for terms in fac_date_terms.values():
+                        if len(terms) > 1:
+                            model.AddAtMostOne(terms)
+                    solver = cp_model.CpSolver()
+                    solver.parameters.num_search_workers = 8
+                    solver.parameters.max_time_in_seconds = 10
+                    status = solver.Solve(model)
+                    if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                        rows = []
+                        for s_idx, slot in enumerate(slots):
+                            for u_idx, unit in enumerate(assign_units):
+                                var = x.get((u_idx, s_idx))
+                                if var is not None and solver.Value(var):
+                                    for f in unit:
+                                        rows.append({"Date": slot["date"], "Shift": slot["shift"], "Faculty": f})
+                        return pd.DataFrame(rows), []
+                # INFEASIBLE or degenerate model: fall through to the greedy
+                # path via the DFS below so the UI still gets underfilled-slot
+                # warnings instead of a hard stop.
+            # Helper: check if a unit is available for a slot.
+            # assigned_masks maps (date, shift) -> int bitmask of faculty
+            # already assigned there; combined with slot_avail/unit_mask the
+            # whole test is a few integer ops.
+            def unit_available(unit, date, shift, duty_counts, assigned_masks):
+                um = unit_mask[unit]
+                if um & ~slot_avail[(date, shift)]:
+                    return False
+                other = 'Second Half' if shift == 'First Half' else 'First Half'
+                if um & assigned_masks.get((date, other), 0):
+                    return False
                 for f in unit:
-                    label = 'first_half' if shift == 'First Half' else 'second_half'
-                    if date in unavailability[f][label]:
-                        return False
-                    if duty_counts.get(f, 0) >= int(max_duties_dict.get(f, 0)):
+                    if duty_counts.get(f, 0) >= max_duties_dict_int[f]:
                         return False
-                    for s in ["First Half", "Second Half"]:
-                        if s != shift and (date, s, f) in assigned_slots:
-                            return False
                 return True
-            def assign_unit(unit, date, shift, duty_counts, assigned_slots):
+            def assign_unit(unit, date, shift, duty_counts, assigned_masks):
                 for f in unit:
                     duty_counts[f] = duty_counts.get(f, 0) + 1
-                    assigned_slots.add((date, shift, f))
-            def unassign_unit(unit, date, shift, duty_counts, assigned_slots):
+                assigned_masks[(date, shift)] |= unit_mask[unit]
+            def unassign_unit(unit, date, shift, duty_counts, assigned_masks):
                 for f in unit:
                     duty_counts[f] -= 1
-                    assigned_slots.remove((date, shift, f))
-            def slot_difficulty(slot, duty_counts, assigned_slots):
-                avail = [u for u in assign_units if unit_available(u, slot["date"], slot["shift"], duty_counts, assigned_slots)]
-                return len(avail)
+                assigned_masks[(date, shift)] &= ~unit_mask[unit]
+            def slot_urgency(slot, assigned_masks):
+                # MRV score straight off the bitmasks: fewer currently
+                # available faculty relative to demand = harder = first
+                other = 'Second Half' if slot['shift'] == 'First Half' else 'First Half'
+                avail_now = slot_avail[(slot['date'], slot['shift'])] & ~assigned_masks.get((slot['date'], other), 0)
+                return bin(avail_now).count('1') - 2 * slot['required']
             # --- Diagnostics: Check per-slot feasibility before assignment ---
             diagnostics_msgs = []
             temp_duty_counts = {f: 0 for f in faculty_list}
-            temp_assigned_slots = set()
+            temp_assigned_masks = defaultdict(int)
             infeasible = False
             for slot in slots:
-                avail = [u for u in assign_units if unit_available(u, slot["date"], slot["shift"], temp_duty_counts, temp_assigned_slots)]
+                avail = [u for u in assign_units if unit_available(u, slot["date"], slot["shift"], temp_duty_counts, temp_assigned_masks)]
                 diagnostics_msgs.append(f"{slot['date']} {slot['shift']}: required = {slot['required']}, available units = {len(avail)}")
                 if len(avail) < slot['required']:
                     diagnostics_msgs.append(f"❌ Not enough available faculty/groups for {slot['date']} {slot['shift']}: required {slot['required']}, available {len(avail)}")
@@ -912,43 +1271,92 @@ elif section == "Duty Assignment":
                 for msg in diagnostics_msgs:
                     print(msg)
                 return None
+            # Compiled solver core: the same DFS over the bitmask
+            # representation, but with all state in flat int64 arrays so
+            # solver_core can JIT it with Numba when installed. int64 masks
+            # cap it at 63 faculty; bigger departments take the Python
+            # solver below.
+            if solver_core is not None and len(fac_index) <= 63:
+                unit_order = sorted(assign_units, key=len, reverse=True)
+                unit_arr = [unit_mask[u] for u in unit_order]
+                slot_avail_arr = [slot_avail[(slot['date'], slot['shift'])] for slot in slots]
+                required_arr = [slot['required'] for slot in slots]
+                slot_pos = {(slot['date'], slot['shift']): i for i, slot in enumerate(slots)}
+                other_arr = []
+                for slot in slots:
+                    other = 'Second Half' if slot['shift'] == 'First Half' else 'First Half'
+                    other_arr.append(slot_pos.get((slot['date'], other), -1))
+                fac_names = list(fac_index)
+                max_arr = [max_duties_dict_int[f] for f in fac_names]
+                found, chosen, filled = solver_core.solve(
+                    unit_arr, slot_avail_arr, required_arr, other_arr, max_arr, len(fac_names))
+                rows = []
+                underfilled_slots = []
+                for s_idx, slot in enumerate(slots):
+                    for u in chosen[s_idx]:
+                        if u >= 0:
+                            for f in unit_order[u]:
+                                rows.append({"Date": slot["date"], "Shift": slot["shift"], "Faculty": f})
+                    if not found and filled[s_idx] < slot['required']:
+                        print(f"[Greedy] Underfilled {slot['date']} {slot['shift']}: required {slot['required']}, assigned {int(filled[s_idx])}")
+                        underfilled_slots.append({"date": slot["date"], "shift": slot["shift"], "required": slot["required"], "assigned": int(filled[s_idx])})
+                if found or rows:
+                    return pd.DataFrame(rows), underfilled_slots
+                print("Greedy fallback also failed: no assignments made.")
+                return None
             # Main backtracking assignment
-            def backtrack(slot_idx, slots, duty_counts, assigned_slots, assignment):
+            def backtrack(slot_idx, slots, duty_counts, assigned_masks, assignment):
                 if slot_idx == len(slots):
                     return True
+                # dynamic MRV: bring the currently hardest remaining slot
+                # forward before expanding this level
+                best = min(range(slot_idx, len(slots)), key=lambda j: slot_urgency(slots[j], assigned_masks))
+                slots[slot_idx], slots[best] = slots[best], slots[slot_idx]
                 slot = slots[slot_idx]
                 date, shift, required = slot["date"], slot["shift"], slot["required"]
-                available_units = [u for u in assign_units if unit_available(u, date, shift, duty_counts, assigned_slots)]
-                available_units = sorted(available_units, key=lambda u: sum(duty_counts.get(f, 0) for f in u))
-                from itertools import combinations
-                for units in combinations(available_units, required):
-                    flat = [f for u in units for f in u]
-                    if len(set(flat)) != len(flat):
-                        continue
-                    for u in units:
-                        assign_unit(u, date, shift, duty_counts, assigned_slots)
-                    assignment.append({"date": date, "shift": shift, "faculty": [f for u in units for f in u]})
-                    if backtrack(slot_idx + 1, slots, duty_counts, assigned_slots, assignment):
-                        return True
-                    assignment.pop()
-                    for u in units:
-                        unassign_unit(u, date, shift, duty_counts, assigned_slots)
-                return False
-            slots_sorted = sorted(slots, key=lambda s: slot_difficulty(s, temp_duty_counts, temp_assigned_slots))
+                available_units = [u for u in assign_units if unit_available(u, date, shift, duty_counts, assigned_masks)]
+                # larger groups first so infeasible branches fail fast, then
+                # least-loaded faculty among equal sizes
+                available_units.sort(key=lambda u: (-len(u), sum(duty_counts.get(f, 0) for f in u)))
+                # Recursive unit picker: an overlap is rejected with one mask
+                # AND before recursing, so whole subtrees of overlapping
+                # combinations are never generated at all
+                def pick(start, remaining, picked_mask, picked):
+                    if remaining == 0:
+                        for u in picked:
+                            assign_unit(u, date, shift, duty_counts, assigned_masks)
+                        assignment.append({"date": date, "shift": shift, "faculty": [f for u in picked for f in u]})
+                        if backtrack(slot_idx + 1, slots, duty_counts, assigned_masks, assignment):
+                            return True
+                        assignment.pop()
+                        for u in picked:
+                            unassign_unit(u, date, shift, duty_counts, assigned_masks)
+                        return False
+                    for i in range(start, len(available_units) - remaining + 1):
+                        u = available_units[i]
+                        if unit_mask[u] & picked_mask:
+                            continue
+                        picked.append(u)
+                        if pick(i + 1, remaining - 1, picked_mask | unit_mask[u], picked):
+                            return True
+                        picked.pop()
+                    return False
+                return pick(0, required, 0, [])
+            slots_sorted = sorted(slots, key=lambda s: slot_urgency(s, {}))
             duty_counts = {f: 0 for f in faculty_list}
-            assigned_slots = set()
+            assigned_masks = defaultdict(int)
             assignment = []
-            found = backtrack(0, slots_sorted, duty_counts, assigned_slots, assignment)
+            found = backtrack(0, slots_sorted, duty_counts, assigned_masks, assignment)
             if not found:
                 # --- Greedy fallback: assign as many as possible to each slot ---
                 print("Backtracking failed, trying greedy fallback...")
                 duty_counts = {f: 0 for f in faculty_list}
-                assigned_slots = set()
+                assigned_masks = defaultdict(int)
                 assignment = []
                 underfilled_slots = []
                 for slot in slots_sorted:
                     date, shift, required = slot["date"], slot["shift"], slot["required"]
-                    available_units = [u for u in assign_units if unit_available(u, date, shift, duty_counts, assigned_slots)]
+                    available_units = [u for u in assign_units if unit_available(u, date, shift, duty_counts, assigned_masks)]
                     available_units = sorted(available_units, key=lambda u: sum(duty_counts.get(f, 0) for f in u))
                     chosen = []
                     used = set()
@@ -962,7 +1370,7 @@ elif section == "Duty Assignment":
                         print(f"[Greedy] Underfilled {date} {shift}: required {required}, assigned {len(chosen)}")
                         underfilled_slots.append({"date": date, "shift": shift, "required": required, "assigned": len(chosen)})
                     for u in chosen:
-                        assign_unit(u, date, shift, duty_counts, assigned_slots)
+                        assign_unit(u, date, shift, duty_counts, assigned_masks)
                     assignment.append({"date": date, "shift": shift, "faculty": [f for u in chosen for f in u]})
                 if not assignment:
                     print("Greedy fallback also failed: no assignments made.")
@@ -987,17 +1395,10 @@ elif section == "Duty Assignment":
         if 'manual_selected' not in st.session_state:
             st.session_state.manual_selected = {}
         st.session_state.manual_selected.clear()
-        for _, row in assigned_df.iterrows():
-            slot_key = f"slot_{to_ddmmyyyy(row['Date'])}_{row['Shift']}"
-            if slot_key not in st.session_state.manual_selected:
-                st.session_state.manual_selected[slot_key] = []
-            st.session_state.manual_selected[slot_key].append(row['Faculty'])
+        for (date, shift), facs in assigned_df.groupby(['Date', 'Shift'], sort=False)['Faculty']:
+            st.session_state.manual_selected[f"slot_{to_ddmmyyyy(date)}_{shift}"] = list(facs)
         # Add contact info if available
-        if not assigned_df.empty:
-            lookup = st.session_state.faculty_df.set_index('faculty').to_dict(orient='index')
-            for col in ['Phone No', 'Email Id', 'Designation']:
-                if col in st.session_state.faculty_df.columns:
-                    assigned_df[col] = assigned_df['Faculty'].map(lambda f: lookup.get(f, {}).get(col, ''))
+        assigned_df = attach_contact_info(assigned_df)
         st.success("Assignments generated with heuristic!")
         # UI warning for under-filled slots
         if underfilled_slots:
@@ -1013,13 +1414,16 @@ elif section == "Duty Assignment":
             st.session_state.faculty_groups,
             st.session_state.exam_schedule
         )
+        # Classify by the structured faculty field instead of substring
+        # scanning every message against every doubled name
+        double_faculties = {f for f, _ in same_day_double}
         warning_msgs = []
         error_msgs = []
-        for err in errors:
-            if any(f in err for f, d in same_day_double):
-                warning_msgs.append(err)
+        for err_faculty, msg in errors:
+            if err_faculty in double_faculties:
+                warning_msgs.append(msg)
             else:
-                error_msgs.append(err)
+                error_msgs.append(msg)
         if error_msgs:
             st.warning("⚠️ Assignment constraint violations detected:")
             for err in error_msgs:
@@ -1032,28 +1436,16 @@ elif section == "Duty Assignment":
             if st.button("Continue with Violations"):
                 st.session_state.assigned_duty_df = assigned_df
                 st.success("Assignments updated with violations!")
-                # Regenerate reports immediately after update
-                df = assigned_df.copy()
-                excel_data = generate_faculty_summary_excel(df, st.session_state.faculty_unavailability)
-                word_data = generate_word_doc(df)
-            else:
-                excel_data = generate_faculty_summary_excel(assigned_df.copy(), st.session_state.faculty_unavailability)
-                word_data = generate_word_doc(assigned_df.copy())
         else:
             st.session_state.assigned_duty_df = assigned_df
             st.success("Assignments updated!")
-            # Regenerate reports immediately after update
-            df = assigned_df.copy()
-            excel_data = generate_faculty_summary_excel(df, st.session_state.faculty_unavailability)
-            word_data = generate_word_doc(df)
+        # Reports come from the cached wrappers, so every branch shares one
+        # generation per distinct assignment frame
+        excel_data, word_data = generate_reports_concurrently(assigned_df, st.session_state.faculty_unavailability)
         st.dataframe(assigned_df)
         # Add report regeneration/download buttons
         st.markdown("---")
         st.markdown("### Regenerate & Download Reports")
-        if 'excel_data' not in locals():
-            excel_data = generate_faculty_summary_excel(df.copy(), st.session_state.faculty_unavailability)
-        if 'word_data' not in locals():
-            word_data = generate_word_doc(df.copy())
         # Show status of report generation
         if excel_data is not None:
             st.success("✅ Excel report generated successfully")
@@ -1082,17 +1474,15 @@ elif section == "Duty Assignment":
                 )
 
         # --- Shift duty warning ---
+        # One value_counts/unstack instead of two boolean-mask filters per faculty
         max_duties_dict = st.session_state.max_duties_dict
-        faculty_list = st.session_state.faculty_df['faculty'].astype(str).str.strip().tolist()
-        for faculty in faculty_list:
-            max_duty = int(max_duties_dict.get(faculty, 0))
-            fh_count = len(assigned_df[(assigned_df['Faculty'] == faculty) & (assigned_df['Shift'] == 'First Half')])
-            sh_count = len(assigned_df[(assigned_df['Faculty'] == faculty) & (assigned_df['Shift'] == 'Second Half')])
-            limit = (max_duty + 1) // 2
-            if fh_count > limit:
-                st.warning(f"⚠️ {faculty} has {fh_count} First Half duties, which exceeds (max duty + 1) // 2 = {limit}.")
-            if sh_count > limit:
-                st.warning(f"⚠️ {faculty} has {sh_count} Second Half duties, which exceeds (max duty + 1) // 2 = {limit}.")
+        faculty_list = get_faculty_list()
+        shift_counts = assigned_df[['Faculty', 'Shift']].value_counts(sort=False).unstack(fill_value=0)
+        shift_counts = shift_counts.reindex(index=faculty_list, columns=['First Half', 'Second Half'], fill_value=0)
+        limits = pd.Series([(int(max_duties_dict.get(f, 0)) + 1) // 2 for f in faculty_list], index=faculty_list)
+        for shift in ['First Half', 'Second Half']:
+            for faculty in shift_counts.index[shift_counts[shift] > limits]:
+                st.warning(f"⚠️ {faculty} has {shift_counts.at[faculty, shift]} {shift} duties, which exceeds (max duty + 1) // 2 = {limits[faculty]}.")
 
 # --- Manual Intervention ---
 elif section == "Manual Intervention":
@@ -1108,38 +1498,30 @@ elif section == "Manual Intervention":
                 summary_df = pd.read_excel(uploaded_summary)
                 # Try to reconstruct assignment DataFrame from summary (if possible)
                 # This expects columns: Faculty, First Half Dates, Second Half Dates
-                assignment_rows = []
-                for _, row in summary_df.iterrows():
-                    faculty = row.get('Faculty', '')
-                    for col, shift in [("First Half Dates", "First Half"), ("Second Half Dates", "Second Half")]:
-                        if pd.notna(row.get(col, '')) and str(row.get(col, '')).strip():
-                            date_strs = [d.strip() for d in str(row[col]).split(',') if d.strip()]
-                            for date_str in date_strs:
-                                date = from_ddmmyyyy(date_str)
-                                if date:
-                                    assignment_rows.append({'Date': date, 'Shift': shift, 'Faculty': faculty})
-                new_df = pd.DataFrame(assignment_rows)
+                # melt + split/explode + one vectorized to_datetime instead of
+                # iterrows with a per-cell date parse
+                value_vars = [c for c in ['First Half Dates', 'Second Half Dates'] if c in summary_df.columns]
+                long = summary_df.melt(id_vars=['Faculty'], value_vars=value_vars,
+                                       var_name='col', value_name='dates').dropna(subset=['dates'])
+                long['Shift'] = long['col'].map({'First Half Dates': 'First Half', 'Second Half Dates': 'Second Half'})
+                long = long.assign(Date=long['dates'].astype(str).str.split(',')).explode('Date')
+                long['Date'] = pd.to_datetime(long['Date'].str.strip(), format='%d-%m-%Y', errors='coerce')
+                long = long.dropna(subset=['Date'])
+                long['Date'] = long['Date'].dt.date
+                new_df = long[['Date', 'Shift', 'Faculty']].reset_index(drop=True)
                 # Add contact info if available
-                if not new_df.empty and st.session_state.faculty_df is not None:
-                    lookup = st.session_state.faculty_df.set_index('faculty').to_dict(orient='index')
-                    for col in ['Phone No', 'Email Id', 'Designation']:
-                        if col in st.session_state.faculty_df.columns:
-                            new_df[col] = new_df['Faculty'].map(lambda f: lookup.get(f, {}).get(col, ''))
+                new_df = attach_contact_info(new_df)
                 st.session_state.assigned_duty_df = new_df
                 # Prefill manual_selected for manual intervention
                 if 'manual_selected' not in st.session_state:
                     st.session_state.manual_selected = {}
                 st.session_state.manual_selected.clear()
-                for _, row in new_df.iterrows():
-                    slot_key = f"slot_{to_ddmmyyyy(row['Date'])}_{row['Shift']}"
-                    if slot_key not in st.session_state.manual_selected:
-                        st.session_state.manual_selected[slot_key] = []
-                    st.session_state.manual_selected[slot_key].append(row['Faculty'])
+                for (date, shift), facs in new_df.groupby(['Date', 'Shift'], sort=False)['Faculty']:
+                    st.session_state.manual_selected[f"slot_{to_ddmmyyyy(date)}_{shift}"] = list(facs)
                 st.success("Assignments regenerated from uploaded summary!")
                 st.dataframe(new_df)
                 # Regenerate Excel/Word reports immediately
-                excel_data = generate_faculty_summary_excel(new_df, st.session_state.faculty_unavailability)
-                word_data = generate_word_doc(new_df)
+                excel_data, word_data = generate_reports_concurrently(new_df, st.session_state.faculty_unavailability)
             except Exception as e:
                 st.error(f"Failed to parse uploaded summary: {e}")
         auto_save_job()
@@ -1155,85 +1537,106 @@ elif section == "Manual Intervention":
         if df.empty:
             df = pd.DataFrame(columns=required_cols)
         if st.session_state.faculty_df is not None:
-            faculty_list = st.session_state.faculty_df['faculty'].astype(str).str.strip().tolist()
+            faculty_list = get_faculty_list()
             # Build a unique list of (date, shift) slots
             slots = df[['Date', 'Shift']].drop_duplicates().sort_values(['Date', 'Shift']).values.tolist()
-            new_assignments = []
+            # Parallel columns instead of a list of per-row dicts: the
+            # dict-of-lists DataFrame constructor takes the fast path
+            assigned_dates, assigned_shifts, assigned_facs = [], [], []
             st.markdown('#### Edit Assignments by Slot')
             # Ensure unavailability and max_duties_dict are defined
             unavailability = st.session_state.faculty_unavailability
             max_duties_dict = st.session_state.max_duties_dict
-            # Recalculate current assignments for all slots after every change
-            # Build a working assignments dict from session_state.manual_selected
+            # O(1) required-count lookups instead of scanning the schedule per slot
+            schedule_by_date = {day['date']: day for day in st.session_state.exam_schedule}
+            # Duty tallies live in three Counters persisted across reruns
+            # alongside the selections they were built from; each rerun only
+            # applies the delta for slots whose selection actually changed
+            # instead of recounting every assignment from scratch
+            if '_manual_tallies' not in st.session_state:
+                st.session_state['_manual_tallies'] = (Counter(), Counter(), Counter(), {})
+            total_ctr, fh_ctr, sh_ctr, prev_assignments = st.session_state['_manual_tallies']
             working_assignments = {}
             for s_date, s_shift in slots:
-                s_slot_key = f"slot_{to_ddmmyyyy(s_date)}_{s_shift}"
-                working_assignments[(s_date, s_shift)] = st.session_state.manual_selected.get(s_slot_key, [])
+                s_slot_key = f"slot_{_fmt_date(s_date)}_{s_shift}"
+                cur = st.session_state.manual_selected.get(s_slot_key, [])
+                working_assignments[(s_date, s_shift)] = cur
+                prev = prev_assignments.get((s_date, s_shift), [])
+                if cur != prev:
+                    shift_ctr = fh_ctr if s_shift == 'First Half' else sh_ctr
+                    total_ctr.update(set(cur) - set(prev))
+                    total_ctr.subtract(set(prev) - set(cur))
+                    shift_ctr.update(set(cur) - set(prev))
+                    shift_ctr.subtract(set(prev) - set(cur))
+            # Drop tallies for slots that no longer exist (e.g. schedule edits)
+            for (s_date, s_shift), prev in prev_assignments.items():
+                if (s_date, s_shift) not in working_assignments:
+                    total_ctr.subtract(prev)
+                    (fh_ctr if s_shift == 'First Half' else sh_ctr).subtract(prev)
+            # Per-(date, half) unavailable-faculty sets and int duty limits,
+            # computed once instead of per slot iteration
+            max_duties_dict_int = {f: int(max_duties_dict.get(f, 0)) for f in faculty_list}
+            unavail_by_date_label = {
+                (d, lab): {f for f in faculty_list if d in unavailability[f][lab]}
+                for d in {s_date for s_date, _ in slots}
+                for lab in ('first_half', 'second_half')
+            }
             for date, shift in slots:
                 slot_df = df[(df['Date'] == date) & (df['Shift'] == shift)]
                 assigned_faculty = slot_df['Faculty'].astype(str).str.strip().tolist()
-                required = 0
-                for day in st.session_state.exam_schedule:
-                    if day['date'] == date:
-                        required = day['first_half'] if shift == "First Half" else day['second_half']
-                        break
+                day = schedule_by_date.get(date)
+                required = 0 if day is None else (day['first_half'] if shift == "First Half" else day['second_half'])
                 assigned_on_date = df[df['Date'] == date]['Faculty'].astype(str).str.strip().tolist()
                 assigned_on_slot = [f for f in assigned_faculty if f]  # filter out empty strings
-                st.markdown(f"**{to_ddmmyyyy(date)} - {shift}**")
-                slot_key = f"slot_{to_ddmmyyyy(date)}_{shift}"
-                # Make a copy of working_assignments and update with the current selection for this slot
-                temp_assignments = working_assignments.copy()
-                temp_assignments[(date, shift)] = st.session_state.manual_selected.get(slot_key, [])
-                # Now calculate counts from temp_assignments
-                all_assigned = []
-                for (s_date, s_shift), facs in temp_assignments.items():
-                    all_assigned.extend(facs)
-                current_duty_counts = pd.Series(all_assigned).value_counts().to_dict()
-                fh_counts = pd.Series([f for (d, s), facs in temp_assignments.items() if s == 'First Half' for f in facs]).value_counts().to_dict()
-                sh_counts = pd.Series([f for (d, s), facs in temp_assignments.items() if s == 'Second Half' for f in facs]).value_counts().to_dict()
+                st.markdown(f"**{_fmt_date(date)} - {shift}**")
+                slot_key = f"slot_{_fmt_date(date)}_{shift}"
                 # For 'no both shifts' rule, get faculty assigned to the other shift on this date
                 other_shift = 'Second Half' if shift == 'First Half' else 'First Half'
-                assigned_to_other_shift = temp_assignments.get((date, other_shift), [])
+                other_set = set(working_assignments.get((date, other_shift), ()))
                 label = 'first_half' if shift == 'First Half' else 'second_half'
+                unavail_set = unavail_by_date_label[(date, label)]
                 # Build available_faculty: all eligible + all already selected for this slot
                 eligible_faculty = [
                     f for f in faculty_list
-                    if (
-                        (
-                            date not in unavailability[f][label] and
-                            f not in assigned_to_other_shift and
-                            current_duty_counts.get(f, 0) < int(max_duties_dict.get(f, 0))
-                        )
-                    )
+                    if f not in unavail_set
+                    and f not in other_set
+                    and total_ctr[f] < max_duties_dict_int.get(f, 0)
                 ]
-                # Always include already selected faculty for this slot (even if over max)
-                available_faculty = sorted(set(eligible_faculty) | set(assigned_on_slot))
-                # Build display options and mapping
-                display_to_faculty = {}
-                faculty_to_display = {}
-                display_options = []
-                for f in available_faculty:
-                    total = current_duty_counts.get(f, 0)
-                    fh = fh_counts.get(f, 0)
-                    sh = sh_counts.get(f, 0)
-                    display = f"{f} (Total: {total}, First Half: {fh}, Second Half: {sh})"
-                    display_options.append(display)
-                    display_to_faculty[display] = f
-                    faculty_to_display[f] = display
+                # Always include already selected faculty for this slot (even
+                # if over max); walk faculty_list so the options keep its
+                # order without a per-slot sort
+                elig_set = set(eligible_faculty)
+                assigned_set = set(assigned_on_slot)
+                available_faculty = [f for f in faculty_list if f in elig_set or f in assigned_set]
+                # names in the frame but not in the roster (e.g. from an old
+                # upload) still need to stay selectable
+                available_faculty += sorted(assigned_set.difference(faculty_list))
+                # Build display options and mapping in one pass; hoisted
+                # Counter lookups keep the inner loop free of attribute
+                # resolution (Counter returns 0 for missing keys)
+                tg, fg, sg = total_ctr.__getitem__, fh_ctr.__getitem__, sh_ctr.__getitem__
+                display_options = [
+                    f"{f} (Total: {tg(f)}, First Half: {fg(f)}, Second Half: {sg(f)})"
+                    for f in available_faculty
+                ]
+                display_to_faculty = dict(zip(display_options, available_faculty))
+                faculty_to_display = dict(zip(available_faculty, display_options))
+                # Hoist the repeated session-state attribute walks and dict
+                # key view out of the filtering expressions below
+                fd_keys = faculty_to_display.keys()
+                ms = st.session_state.manual_selected
                 # Now define valid_assigned_on_slot after faculty_to_display is built
-                valid_assigned_on_slot = [f for f in assigned_on_slot if f in faculty_to_display]
+                valid_assigned_on_slot = [f for f in assigned_on_slot if f in fd_keys]
                 # Trim to max allowed
                 if required > 0 and len(valid_assigned_on_slot) > required:
                     valid_assigned_on_slot = valid_assigned_on_slot[:required]
-                if slot_key not in st.session_state.manual_selected:
-                    st.session_state.manual_selected[slot_key] = valid_assigned_on_slot
-                # Also filter session_state.manual_selected[slot_key] to valid options and max_selections
-                st.session_state.manual_selected[slot_key] = [
-                    f for f in st.session_state.manual_selected[slot_key] if f in faculty_to_display
-                ][:required if required > 0 else None]
-                default_display = [faculty_to_display[f] for f in st.session_state.manual_selected[slot_key] if f in faculty_to_display]
+                if slot_key not in ms:
+                    ms[slot_key] = valid_assigned_on_slot
+                # Also filter manual_selected[slot_key] to valid options and max_selections
+                ms[slot_key] = [f for f in ms[slot_key] if f in fd_keys][:required or None]
+                default_display = [faculty_to_display[f] for f in ms[slot_key]]
                 selected_display = st.multiselect(
-                    f"Assign Faculty for {to_ddmmyyyy(date)} {shift} (Required: {required})",
+                    f"Assign Faculty for {_fmt_date(date)} {shift} (Required: {required})",
                     options=display_options,
                     default=default_display,
                     key=slot_key,
@@ -1241,40 +1644,84 @@ elif section == "Manual Intervention":
                 )
                 # Map back to faculty names for saving and display
                 selected = [display_to_faculty[d] for d in selected_display]
-                st.session_state.manual_selected[slot_key] = selected
+                ms[slot_key] = selected
+                # Apply only this slot's delta to the tallies so later slots
+                # in the loop see up-to-date counts
+                prev_selected = working_assignments.get((date, shift), [])
+                added = set(selected) - set(prev_selected)
+                removed = set(prev_selected) - set(selected)
+                if added or removed:
+                    shift_ctr = fh_ctr if shift == 'First Half' else sh_ctr
+                    total_ctr.update(added)
+                    total_ctr.subtract(removed)
+                    shift_ctr.update(added)
+                    shift_ctr.subtract(removed)
+                    working_assignments[(date, shift)] = selected
                 assigned_count = len(selected)
                 color = '#5cb85c' if assigned_count == required else '#d9534f'
-                st.markdown(f"<span style='color: {color}; font-weight: 600;'>{assigned_count} faculty assigned on {to_ddmmyyyy(date)} {shift}, required: {required}.</span>", unsafe_allow_html=True)
+                st.markdown(f"<span style='color: {color}; font-weight: 600;'>{assigned_count} faculty assigned on {_fmt_date(date)} {shift}, required: {required}.</span>", unsafe_allow_html=True)
                 if selected:
                     st.markdown("**Selected Faculty:**<br>" + ", ".join(selected), unsafe_allow_html=True)
                 for f in selected:
-                    new_assignments.append({'Date': date, 'Shift': shift, 'Faculty': f})
-            new_df = pd.DataFrame(new_assignments)
-            # Defensive check for required columns
-            for col in required_cols:
-                if col not in new_df.columns:
-                    new_df[col] = None
-            if not new_df.empty:
-                lookup = st.session_state.faculty_df.set_index('faculty').to_dict(orient='index')
-                for col in ['Phone No', 'Email Id', 'Designation']:
-                    if col in st.session_state.faculty_df.columns:
-                        new_df[col] = new_df['Faculty'].map(lambda f: lookup.get(f, {}).get(col, ''))
-            is_valid, errors, same_day_double = validate_assignment_constraints(
-                new_df,
-                faculty_list,
-                st.session_state.max_duties_dict,
-                st.session_state.faculty_unavailability,
-                st.session_state.faculty_groups,
-                st.session_state.exam_schedule
+                    assigned_dates.append(date)
+                    assigned_shifts.append(shift)
+                    assigned_facs.append(f)
+            # Persist the tallies with the selections they now reflect so the
+            # next rerun only has to reconcile changed slots
+            st.session_state['_manual_tallies'] = (total_ctr, fh_ctr, sh_ctr, dict(working_assignments))
+            # Fingerprint the selections (plus the roster content providing
+            # contact columns) so idle reruns — tab switches, widget touches
+            # that change nothing — reuse the previously built frame instead
+            # of reconstructing and re-joining it
+            fdf = st.session_state.get('faculty_df')
+            roster_cols = [] if fdf is None else [c for c in ['faculty', 'Phone No', 'Email Id', 'Designation'] if c in fdf.columns]
+            manual_fp = (
+                hash(tuple(sorted((k, tuple(v)) for k, v in st.session_state.manual_selected.items()))),
+                () if fdf is None else tuple(fdf[roster_cols].itertuples(index=False, name=None)),
+            )
+            cached_frame = st.session_state.get('_manual_frame')
+            if cached_frame is not None and cached_frame[0] == manual_fp:
+                new_df = cached_frame[1]
+            else:
+                new_df = pd.DataFrame({'Date': assigned_dates, 'Shift': assigned_shifts, 'Faculty': assigned_facs})
+                # Defensive check for required columns
+                for col in required_cols:
+                    if col not in new_df.columns:
+                        new_df[col] = None
+                new_df = attach_contact_info(new_df)
+                st.session_state['_manual_frame'] = (manual_fp, new_df)
+            # Re-validate only when a selection (or a validation input)
+            # actually changed; widget interactions that leave the
+            # assignments alone reuse the memoized result
+            validation_key = (
+                tuple(sorted((_fmt_date(d), s, tuple(sorted(facs))) for (d, s), facs in working_assignments.items())),
+                _unavail_cache_key(st.session_state.faculty_unavailability),
+                tuple(tuple(sorted(g)) for g in st.session_state.faculty_groups),
+                tuple(sorted((f, str(v)) for f, v in st.session_state.max_duties_dict.items())),
+                tuple((day['date'], day['first_half'], day['second_half']) for day in st.session_state.exam_schedule),
             )
+            cached_validation = st.session_state.get('_validation_cache')
+            if cached_validation is not None and cached_validation[0] == validation_key:
+                is_valid, errors, same_day_double = cached_validation[1]
+            else:
+                is_valid, errors, same_day_double = validate_assignment_constraints(
+                    new_df,
+                    faculty_list,
+                    st.session_state.max_duties_dict,
+                    st.session_state.faculty_unavailability,
+                    st.session_state.faculty_groups,
+                    st.session_state.exam_schedule
+                )
+                st.session_state['_validation_cache'] = (validation_key, (is_valid, errors, same_day_double))
             # In Manual Intervention, show both-shift errors as warnings, others as errors
+            double_faculties = {f for f, _ in same_day_double}
             warning_msgs = []
             error_msgs = []
-            for err in errors:
-                if any(f in err for f, d in same_day_double):
-                    warning_msgs.append(err)
+            for err_faculty, msg in errors:
+                if err_faculty in double_faculties:
+                    warning_msgs.append(msg)
                 else:
-                    error_msgs.append(err)
+                    error_msgs.append(msg)
             if error_msgs:
                 st.warning("⚠️ Assignment constraint violations detected:")
                 for err in error_msgs:
@@ -1287,28 +1734,36 @@ elif section == "Manual Intervention":
                 if st.button("Continue with Violations"):
                     st.session_state.assigned_duty_df = new_df
                     st.success("Assignments updated with violations!")
-                    # Regenerate reports immediately after update
-                    df = new_df.copy()
-                    excel_data = generate_faculty_summary_excel(df, st.session_state.faculty_unavailability)
-                    word_data = generate_word_doc(df)
+                    report_df = new_df
                 else:
-                    excel_data = generate_faculty_summary_excel(df.copy(), st.session_state.faculty_unavailability)
-                    word_data = generate_word_doc(df.copy())
+                    # violations not accepted: keep reporting the stored frame
+                    report_df = df
             else:
                 st.session_state.assigned_duty_df = new_df
                 st.success("Assignments updated!")
-                # Regenerate reports immediately after update
-                df = new_df.copy()
-                excel_data = generate_faculty_summary_excel(df, st.session_state.faculty_unavailability)
-                word_data = generate_word_doc(df)
+                report_df = new_df
+            # One cached (and concurrent) generation shared by every branch.
+            # A session-level key over everything the reports depend on lets
+            # idle reruns skip even the cache dispatch (thread pool + frame
+            # hashing); real changes fall through to the cached generators
+            report_key = (
+                manual_fp,
+                report_df is new_df,
+                validation_key[1],  # unavailability feeds the excel summary
+                st.session_state.get('exam_type'),
+                st.session_state.get('semester'),
+                st.session_state.get('year'),
+            )
+            cached_reports = st.session_state.get('_manual_reports')
+            if cached_reports is not None and cached_reports[0] == report_key:
+                excel_data, word_data = cached_reports[1]
+            else:
+                excel_data, word_data = generate_reports_concurrently(report_df, st.session_state.faculty_unavailability)
+                st.session_state['_manual_reports'] = (report_key, (excel_data, word_data))
             st.dataframe(new_df)
             # Add report regeneration/download buttons
             st.markdown("---")
             st.markdown("### Regenerate & Download Reports")
-            if 'excel_data' not in locals():
-                excel_data = generate_faculty_summary_excel(df.copy(), st.session_state.faculty_unavailability)
-            if 'word_data' not in locals():
-                word_data = generate_word_doc(df.copy())
             # Show status of report generation
             if excel_data is not None:
                 st.success("✅ Excel report generated successfully")
@@ -1337,17 +1792,15 @@ elif section == "Manual Intervention":
                     )
 
             # --- Shift duty warning ---
+            # One value_counts/unstack instead of two boolean-mask scans per faculty
             max_duties_dict = st.session_state.max_duties_dict
-            faculty_list = st.session_state.faculty_df['faculty'].astype(str).str.strip().tolist()
-            for faculty in faculty_list:
-                max_duty = int(max_duties_dict.get(faculty, 0))
-                fh_count = len(new_df[(new_df['Faculty'] == faculty) & (new_df['Shift'] == 'First Half')])
-                sh_count = len(new_df[(new_df['Faculty'] == faculty) & (new_df['Shift'] == 'Second Half')])
-                limit = (max_duty + 1) // 2
-                if fh_count > limit:
-                    st.warning(f"⚠️ {faculty} has {fh_count} First Half duties, which exceeds (max duty + 1) // 2 = {limit}.")
-                if sh_count > limit:
-                    st.warning(f"⚠️ {faculty} has {sh_count} Second Half duties, which exceeds (max duty + 1) // 2 = {limit}.")
+            faculty_list = get_faculty_list()
+            shift_counts = new_df[['Faculty', 'Shift']].value_counts(sort=False).unstack(fill_value=0)
+            shift_counts = shift_counts.reindex(index=faculty_list, columns=['First Half', 'Second Half'], fill_value=0)
+            limits = pd.Series([(int(max_duties_dict.get(f, 0)) + 1) // 2 for f in faculty_list], index=faculty_list)
+            for shift in ['First Half', 'Second Half']:
+                for faculty in shift_counts.index[shift_counts[shift] > limits]:
+                    st.warning(f"⚠️ {faculty} has {shift_counts.at[faculty, shift]} {shift} duties, which exceeds (max duty + 1) // 2 = {limits[faculty]}.")
         else:
             st.warning("Faculty list is not loaded. Please upload faculty details first.")
             st.stop()
@@ -1379,12 +1832,10 @@ elif section == "Reports & Downloads":
             df_display['Date'] = df_display['Date'].apply(to_ddmmyyyy)
         df_display.insert(0, 'S.No', range(1, len(df_display) + 1))
         st.dataframe(df_display)
-        # Download buttons (Excel, Word, CSV) using gd45.py logic
-        excel_data = generate_faculty_summary_excel(
-            df.copy(),
-            st.session_state.faculty_unavailability
-        )
-        word_data = generate_word_doc(df.copy())
+        # Download buttons (Excel, Word, CSV) using gd45.py logic.
+        # The generators copy internally, so pass the frame by reference and
+        # let the cached wrappers skip regeneration on unrelated reruns.
+        excel_data, word_data = generate_reports_concurrently(df, st.session_state.faculty_unavailability)
         col1, col2 = st.columns(2)
         with col1:
             if excel_data is not None:
@@ -1416,7 +1867,7 @@ elif section == "Reports & Downloads":
             # --- FIX: Use values, not literal string ---
             exam_col = f"{exam_type} {semester} {year}"
             # Calculate current load per faculty
-            faculty_list = st.session_state.faculty_df['faculty'].astype(str).str.strip().tolist()
+            faculty_list = get_faculty_list()
             load_dict = {f: 0 for f in faculty_list}
             for faculty in faculty_list:
                 load_dict[faculty] = len(df[df['Faculty'] == faculty])
@@ -0,0 +1,124 @@
+# Pure-integer core of the fallback duty-assignment solver. All state is
+# bitmasks (bit i = faculty i) and flat int64 arrays, so the hot recursion
+# compiles with Numba when it is installed; without Numba the same functions
+# run as plain Python. int64 masks cap this module at 63 faculty — the app
+# keeps its Python-int solver for larger departments.
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # no-op decorator so the module works without Numba
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def wrap(func):
+            return func
+        return wrap
+
+@njit(cache=True)
+def _unit_ok(u, s, unit_masks, slot_avail, slot_other, assigned, counts, max_duties, n_faculty):
+    um = unit_masks[u]
+    if um & ~slot_avail[s]:
+        return False
+    if um & assigned[s]:
+        return False
+    o = slot_other[s]
+    if o >= 0 and um & assigned[o]:
+        return False
+    for i in range(n_faculty):
+        if (um >> i) & 1 and counts[i] >= max_duties[i]:
+            return False
+    return True
+
+@njit(cache=True)
+def _apply(u, s, sign, unit_masks, assigned, counts, n_faculty):
+    um = unit_masks[u]
+    for i in range(n_faculty):
+        if (um >> i) & 1:
+            counts[i] += sign
+    if sign > 0:
+        assigned[s] |= um
+    else:
+        assigned[s] &= ~um
+
+@njit(cache=True)
+def _backtrack(pos, start, remaining, slot_order, slot_required, slot_avail,
+               slot_other, unit_masks, max_duties, counts, assigned, chosen,
+               n_faculty):
+    n_slots = slot_order.shape[0]
+    if remaining == 0:
+        pos += 1
+        if pos == n_slots:
+            return True
+        return _backtrack(pos, 0, slot_required[slot_order[pos]], slot_order,
+                          slot_required, slot_avail, slot_other, unit_masks,
+                          max_duties, counts, assigned, chosen, n_faculty)
+    s = slot_order[pos]
+    n_units = unit_masks.shape[0]
+    # picking in increasing index order: fewer than `remaining` candidates
+    # left means this branch cannot finish
+    for u in range(start, n_units - remaining + 1):
+        if not _unit_ok(u, s, unit_masks, slot_avail, slot_other, assigned, counts, max_duties, n_faculty):
+            continue
+        _apply(u, s, 1, unit_masks, assigned, counts, n_faculty)
+        chosen[s, slot_required[s] - remaining] = u
+        if _backtrack(pos, u + 1, remaining - 1, slot_order, slot_required,
+                      slot_avail, slot_other, unit_masks, max_duties, counts,
+                      assigned, chosen, n_faculty):
+            return True
+        chosen[s, slot_required[s] - remaining] = -1
+        _apply(u, s, -1, unit_masks, assigned, counts, n_faculty)
+    return False
+
+@njit(cache=True)
+def _greedy(slot_order, slot_required, slot_avail, slot_other, unit_masks,
+            max_duties, counts, assigned, chosen, filled, n_faculty):
+    n_units = unit_masks.shape[0]
+    for pos in range(slot_order.shape[0]):
+        s = slot_order[pos]
+        got = 0
+        for u in range(n_units):
+            if got >= slot_required[s]:
+                break
+            if _unit_ok(u, s, unit_masks, slot_avail, slot_other, assigned, counts, max_duties, n_faculty):
+                _apply(u, s, 1, unit_masks, assigned, counts, n_faculty)
+                chosen[s, got] = u
+                got += 1
+        filled[s] = got
+
+def solve(unit_masks, slot_avail, slot_required, slot_other, max_duties, n_faculty):
+    # Returns (found, chosen, filled). chosen[s, j] is the index of the j-th
+    # unit picked for slot s (-1 padding); filled[s] is the unit count each
+    # slot got (equals required on a full solution). Callers should pass
+    # units sorted largest-group-first so infeasible branches fail early.
+    unit_masks = np.asarray(unit_masks, dtype=np.int64)
+    slot_avail = np.asarray(slot_avail, dtype=np.int64)
+    slot_required = np.asarray(slot_required, dtype=np.int64)
+    slot_other = np.asarray(slot_other, dtype=np.int64)
+    max_duties = np.asarray(max_duties, dtype=np.int64)
+    n_slots = slot_required.shape[0]
+    max_req = int(slot_required.max()) if n_slots else 0
+    chosen = np.full((n_slots, max(max_req, 1)), -1, dtype=np.int64)
+    filled = slot_required.copy()
+    if n_slots == 0:
+        return True, chosen, filled
+    # hardest slots first: fewest spare units that fit the availability mask
+    spare = np.array([
+        int(sum((unit_masks & ~slot_avail[s]) == 0)) - int(slot_required[s])
+        for s in range(n_slots)], dtype=np.int64)
+    slot_order = np.argsort(spare, kind='stable').astype(np.int64)
+    counts = np.zeros(n_faculty, dtype=np.int64)
+    assigned = np.zeros(n_slots, dtype=np.int64)
+    found = _backtrack(0, 0, int(slot_required[slot_order[0]]), slot_order,
+                       slot_required, slot_avail, slot_other, unit_masks,
+                       max_duties, counts, assigned, chosen, n_faculty)
+    if found:
+        return True, chosen, filled
+    counts[:] = 0
+    assigned[:] = 0
+    chosen[:] = -1
+    filled = np.zeros(n_slots, dtype=np.int64)
+    _greedy(slot_order, slot_required, slot_avail, slot_other, unit_masks,
+            max_duties, counts, assigned, chosen, filled, n_faculty)
+    return False, chosen, filled